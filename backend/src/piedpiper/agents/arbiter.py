@@ -13,6 +13,8 @@ the issue type. It uses multi-signal detection:
 
 from __future__ import annotations
 
+from itertools import islice
+
 from piedpiper.models.queries import ExpertQuery, IssueType
 from piedpiper.models.state import WorkerState
 
@@ -57,7 +59,7 @@ class ArbiterAgent:
         """Check if worker is repeating the same actions."""
         if len(state.action_history) < 5:
             return False
-        recent = state.action_history[-10:]
+        recent = islice(reversed(state.action_history), 10)
         signatures = [f"{a.action_type}:{a.description[:50]}" for a in recent]
         return len(set(signatures)) < 3
 
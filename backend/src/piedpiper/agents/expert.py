@@ -24,11 +24,16 @@ with code examples when appropriate. Be concise but thorough."""
 class ExpertAgent:
     """Answers escalated questions with self-improving context."""
 
-    def __init__(self, model: str = "deepseek-ai/DeepSeek-R1-0528"):
+    def __init__(
+        self,
+        model: str = "deepseek-ai/DeepSeek-R1-0528",
+        client: AsyncOpenAI | None = None,
+    ):
         self.model = model
         self.system_prompt = EXPERT_SYSTEM_PROMPT
         self.learning = ExpertLearningModule()
-        self._client: AsyncOpenAI | None = None
+        # Shared W&B Inference client when injected, otherwise created lazily
+        self._client: AsyncOpenAI | None = client
 
     def _get_client(self) -> AsyncOpenAI:
         """Get or create OpenAI client for W&B Inference."""
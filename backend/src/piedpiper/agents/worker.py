@@ -8,6 +8,8 @@ persona (junior/intermediate/senior) and model via W&B Inference.
 
 from __future__ import annotations
 
+import asyncio
+
 from openai import AsyncOpenAI
 
 from piedpiper.config import settings
@@ -17,11 +19,12 @@ from piedpiper.models.state import WorkerConfig, WorkerState
 class WorkerAgent:
     """Manages a single worker's execution lifecycle."""
 
-    def __init__(self, config: WorkerConfig):
+    def __init__(self, config: WorkerConfig, client: AsyncOpenAI | None = None):
         self.config = config
         self.sandbox_id: str | None = None
         self._daytona = None  # Lazy load Daytona SDK
-        self._client: AsyncOpenAI | None = None
+        # Shared W&B Inference client when injected, otherwise created lazily
+        self._client: AsyncOpenAI | None = client
 
     def _get_client(self) -> AsyncOpenAI:
         """Get or create OpenAI client for W&B Inference."""
@@ -59,7 +62,9 @@ class WorkerAgent:
             auto_stop_interval=0,  # Disable auto-stop
         )
         
-        sandbox = self._daytona.create(params)
+        # The Daytona SDK is synchronous; keep the blocking create off the
+        # event loop so sandboxes for several workers provision concurrently
+        sandbox = await asyncio.to_thread(self._daytona.create, params)
         self.sandbox_id = sandbox.id
 
         print(f"✓ Created Daytona sandbox {sandbox.id} for worker {self.config.id}")
@@ -33,15 +33,7 @@ class CostController:
         )
 
         async with self._lock:
-            self.tracker.entries.append(entry)
-            if agent_type == "workers":
-                self.tracker.spent_workers += cost
-            elif agent_type == "expert":
-                self.tracker.spent_expert += cost
-            elif agent_type == "browserbase":
-                self.tracker.spent_browserbase += cost
-            elif agent_type == "embeddings":
-                self.tracker.spent_embeddings += cost
+            self.tracker.add_entry(entry)
 
         return cost
 
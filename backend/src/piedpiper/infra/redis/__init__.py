@@ -1,11 +1,13 @@
 """Redis integration package.
 
 This package contains all Redis-related functionality:
+- Shared client / connection pool
 - Embedding generation and caching
 - Hybrid knowledge base (vector + keyword search)
 - Medium-term memory storage
 """
 
+from piedpiper.infra.redis.client import get_client
 from piedpiper.infra.redis.embeddings import EmbeddingService
 from piedpiper.infra.redis.memory import (
     MemorySystem,
@@ -24,4 +26,5 @@ __all__ = [
     "PostgresLongTermStore",
     "WorkerMemory",
     "SharedPlaybook",
+    "get_client",
 ]
@@ -0,0 +1,51 @@
+"""Shared Redis client.
+
+Owner: Person 3 (Infrastructure)
+
+One client per URL and event loop, so every caller on a loop shares a single
+connection pool instead of paying a TCP (+TLS) handshake per client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from redis.asyncio import Redis
+
+from piedpiper.config import settings
+
+# Event loop → URL → client. redis.asyncio connections are bound to the loop
+# that opened them, so a client is never handed to a different loop.
+_clients: dict[asyncio.AbstractEventLoop, dict[str, Redis]] = {}
+
+
+def get_client(url: str | None = None) -> Redis:
+    """Return the running loop's shared client for url (defaults to ``settings.redis_url``).
+
+    Must be called from a coroutine. Connections are opened lazily and reopened
+    after close(), so the client can be reused within one lifespan; a new event
+    loop (another lifespan, another test) gets a client of its own.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients.get(loop)
+    if clients is None:
+        # Drop clients left behind by loops that have since been closed
+        for stale in [other for other in _clients if other.is_closed()]:
+            del _clients[stale]
+        clients = _clients[loop] = {}
+    url = url or settings.redis_url
+    client = clients.get(url)
+    if client is None:
+        client = clients[url] = _new_client(url)
+    return client
+
+
+def _new_client(url: str) -> Redis:
+    return Redis.from_url(
+        url,
+        encoding="utf-8",
+        decode_responses=False,  # We'll handle encoding ourselves
+        # Keep idle pooled connections alive through cloud load balancers
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
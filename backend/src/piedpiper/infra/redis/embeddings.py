@@ -7,8 +7,8 @@ Handles text embedding generation using OpenAI's API.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
 from typing import Any
 
@@ -23,11 +23,19 @@ class EmbeddingService:
 
     EMBEDDING_MODEL = "text-embedding-3-small"  # 1536 dimensions, cost-effective
     EMBEDDING_DIMENSIONS = 1536
+    # Uncached embed() calls arriving within this window share one API request
+    EMBED_BATCH_WINDOW_SECONDS = 0.005
+    EMBED_BATCH_MAX = 32
 
     def __init__(self, openai_api_key: str, redis_client: Any | None = None):
         self.client = AsyncOpenAI(api_key=openai_api_key)
         self.redis = redis_client
         self._cache_prefix = "embedding:"
+        # Strong references to background tasks (batched requests, cache writes)
+        self._background: set[asyncio.Task] = set()
+        # Text → futures of embed() callers waiting on the next batched request
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     async def embed(self, text: str) -> np.ndarray:
         """Generate embedding for text with Redis caching.
@@ -49,19 +57,17 @@ class EmbeddingService:
                 logger.debug(f"Embedding cache hit for: {text[:50]}...")
                 return cached
 
-        # Generate embedding
+        # Generate embedding, coalesced with other concurrent callers
         logger.debug(f"Generating embedding for: {text[:50]}...")
-        response = await self.client.embeddings.create(
-            model=self.EMBEDDING_MODEL, input=text, encoding_format="float"
-        )
-
-        embedding = np.array(response.data[0].embedding, dtype=np.float32)
-
-        # Cache the result
-        if self.redis:
-            await self._cache_embedding(cache_key, embedding)
-
-        return embedding
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(text, []).append(future)
+        if len(self._pending) >= self.EMBED_BATCH_MAX:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.EMBED_BATCH_WINDOW_SECONDS, self._flush_pending
+            )
+        return await future
 
     async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
         """Generate embeddings for multiple texts efficiently.
@@ -85,9 +91,10 @@ class EmbeddingService:
         texts_to_generate: list[tuple[int, str]] = []
 
         if self.redis:
-            for idx, text in valid_texts:
-                cache_key = self._get_cache_key(text)
-                cached = await self._get_cached_embedding(cache_key)
+            cached_batch = await self._get_cached_embeddings(
+                [self._get_cache_key(text) for _, text in valid_texts]
+            )
+            for (idx, text), cached in zip(valid_texts, cached_batch):
                 if cached is not None:
                     embeddings[idx] = cached
                 else:
@@ -104,41 +111,105 @@ class EmbeddingService:
                 encoding_format="float",
             )
 
+            generated: list[tuple[str, np.ndarray]] = []
             for i, (original_idx, text) in enumerate(texts_to_generate):
                 embedding = np.array(response.data[i].embedding, dtype=np.float32)
                 embeddings[original_idx] = embedding
+                generated.append((self._get_cache_key(text), embedding))
 
-                # Cache the result
-                if self.redis:
-                    cache_key = self._get_cache_key(text)
-                    await self._cache_embedding(cache_key, embedding)
+            # Cache the results without holding up the caller
+            if self.redis:
+                self._spawn(self._cache_embeddings(generated))
 
         return [emb for emb in embeddings if emb is not None]
 
+    def _flush_pending(self):
+        """Send every text queued by embed() in one background API request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            self._spawn(self._embed_pending(pending))
+
+    async def _embed_pending(self, pending: dict[str, list[asyncio.Future]]):
+        """Embed a micro-batch and resolve each waiting caller's future."""
+        texts = list(pending)
+        generated: list[tuple[str, np.ndarray]] = []
+        try:
+            response = await self.client.embeddings.create(
+                model=self.EMBEDDING_MODEL, input=texts, encoding_format="float"
+            )
+            for text, item in zip(texts, response.data):
+                embedding = np.array(item.embedding, dtype=np.float32)
+                for future in pending[text]:
+                    if not future.done():
+                        future.set_result(embedding)
+                generated.append((self._get_cache_key(text), embedding))
+            if len(generated) != len(texts):
+                raise RuntimeError(
+                    f"Expected {len(texts)} embeddings, got {len(generated)}"
+                )
+        except BaseException as e:
+            # Failed, short or cancelled: no caller may be left waiting
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            if isinstance(e, Exception):
+                logger.warning(f"Batched embedding request failed: {e}")
+                return
+            raise
+
+        if self.redis:
+            await self._cache_embeddings(generated)
+
+    def _spawn(self, coro):
+        """Run a coroutine in the background (batched requests, best-effort cache writes)."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
     def _get_cache_key(self, text: str) -> str:
         """Generate cache key for text."""
-        text_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+        # BLAKE2b is faster than SHA-256 and plenty for non-adversarial dedup
+        text_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
         return f"{self._cache_prefix}{self.EMBEDDING_MODEL}:{text_hash}"
 
     async def _get_cached_embedding(self, cache_key: str) -> np.ndarray | None:
         """Retrieve cached embedding from Redis."""
         try:
-            cached_json = await self.redis.get(cache_key)
-            if cached_json:
-                data = json.loads(cached_json)
-                return np.array(data, dtype=np.float32)
+            cached = await self.redis.get(cache_key)
+            if cached:
+                return np.frombuffer(cached, dtype=np.float32)
         except Exception as e:
             logger.warning(f"Failed to retrieve cached embedding: {e}")
         return None
 
-    async def _cache_embedding(self, cache_key: str, embedding: np.ndarray):
-        """Cache embedding in Redis with 7-day TTL."""
+    async def _get_cached_embeddings(self, cache_keys: list[str]) -> list[np.ndarray | None]:
+        """Retrieve several cached embeddings from Redis in one MGET."""
+        try:
+            values = await self.redis.mget(cache_keys)
+            return [
+                np.frombuffer(value, dtype=np.float32) if value else None
+                for value in values
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to retrieve cached embeddings: {e}")
+        return [None] * len(cache_keys)
+
+    async def _cache_embeddings(self, items: list[tuple[str, np.ndarray]]):
+        """Cache several embeddings with one pipelined round-trip.
+
+        Vectors are stored as raw FLOAT32 bytes, read back with np.frombuffer().
+        """
         try:
-            # Store as JSON list for readability
-            embedding_json = json.dumps(embedding.tolist())
-            await self.redis.setex(cache_key, 604800, embedding_json)  # 7 days
+            pipe = self.redis.pipeline(transaction=False)
+            for cache_key, embedding in items:
+                pipe.setex(cache_key, 604800, embedding.astype(np.float32).tobytes())  # 7 days
+            await pipe.execute()
         except Exception as e:
-            logger.warning(f"Failed to cache embedding: {e}")
+            logger.warning(f"Failed to cache embeddings: {e}")
 
     def get_cost_per_embedding(self) -> float:
         """Get cost per embedding in USD.
@@ -8,42 +8,75 @@ and keyword search results from Redis Stack.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
 import numpy as np
+import orjson
 from redis.commands.search.field import TagField, TextField, VectorField
 from redis.commands.search.indexDefinition import IndexDefinition, IndexType
 from redis.commands.search.query import Query
 
+from piedpiper.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+# JSON.SET / JSON.GET are sent as raw commands and (de)serialized here with
+# orjson. redis_client.json() would install its decoder as the JSON.* response
+# callbacks of the client, which get_client() shares process-wide.
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a document; orjson serializes numpy arrays without ``.tolist()``."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json_loads(reply: Any) -> Any:
+    """Decode a raw JSON.GET reply (None for a missing key)."""
+    # Left as-is if some other caller's redis.json() already decoded it
+    return orjson.loads(reply) if isinstance(reply, (bytes, str)) else reply
+
+
 class HybridKnowledgeBase:
     """Redis-backed hybrid search with vector + BM25 + RRF."""
 
     VECTOR_INDEX_NAME = "idx:knowledge:vector"
     KEYWORD_INDEX_NAME = "idx:knowledge:keyword"
     KEY_PREFIX = "knowledge:"
+    QUERY_EMBEDDING_CACHE_SIZE = 1024
+    DOCUMENT_CACHE_SIZE = 1024
+    # Fields returned to callers; the stored embeddings stay in Redis
+    RESULT_PATHS = ("$.id", "$.question", "$.answer", "$.metadata")
     
     def __init__(self, redis_client: Any, embedding_service: Any):
         self.redis = redis_client
         self.embedding_service = embedding_service
+        # Search client for the knowledge index, built once and reused per query
+        self.index = redis_client.ft(self.VECTOR_INDEX_NAME)
+        # Normalized query text → FLOAT32 vector bytes, most recently used last
+        self._query_vectors: OrderedDict[str, bytes] = OrderedDict()
+        # Document ID → fetched fields. Documents are never rewritten after
+        # store() (each store mints a new ID), so entries cannot go stale.
+        self._documents: OrderedDict[str, dict] = OrderedDict()
 
     async def initialize_indices(self):
         """Create Redis search indices (vector_idx and keyword_idx).
 
         Call once on startup.
         """
-        try:
-            # Try to get existing index info - if it exists, we're done
-            await self.redis.ft(self.VECTOR_INDEX_NAME).info()
+        existing = {
+            name.decode() if isinstance(name, bytes) else name
+            for name in await self.redis.execute_command("FT._LIST")
+        }
+        if self.VECTOR_INDEX_NAME in existing:
             logger.info(f"Vector index '{self.VECTOR_INDEX_NAME}' already exists")
-        except Exception:
+        else:
             # Index doesn't exist, create it
             logger.info(f"Creating vector index '{self.VECTOR_INDEX_NAME}'...")
             
@@ -52,21 +85,27 @@ class HybridKnowledgeBase:
                 TextField("$.answer", as_name="answer"),
                 VectorField(
                     "$.question_embedding",
-                    "FLAT",
+                    "HNSW",
                     {
                         "TYPE": "FLOAT32",
                         "DIM": self.embedding_service.EMBEDDING_DIMENSIONS,
                         "DISTANCE_METRIC": "COSINE",
+                        "M": 16,
+                        "EF_CONSTRUCTION": 200,
+                        "EF_RUNTIME": 50,
                     },
                     as_name="question_vector",
                 ),
                 VectorField(
                     "$.answer_embedding",
-                    "FLAT",
+                    "HNSW",
                     {
                         "TYPE": "FLOAT32",
                         "DIM": self.embedding_service.EMBEDDING_DIMENSIONS,
                         "DISTANCE_METRIC": "COSINE",
+                        "M": 16,
+                        "EF_CONSTRUCTION": 200,
+                        "EF_RUNTIME": 50,
                     },
                     as_name="answer_vector",
                 ),
@@ -79,7 +118,7 @@ class HybridKnowledgeBase:
                 index_type=IndexType.JSON,
             )
             
-            await self.redis.ft(self.VECTOR_INDEX_NAME).create_index(
+            await self.index.create_index(
                 fields=schema,
                 definition=definition,
             )
@@ -91,49 +130,186 @@ class HybridKnowledgeBase:
     async def search(self, query: str, top_k: int = 5) -> tuple[list[dict], float]:
         """Hybrid search: vector + BM25 with RRF reranking.
 
+        If the top vector hit is within ``settings.cache_hit_threshold`` cosine
+        distance, it is returned alone without keyword search or fusion.
+
         Returns:
             Tuple of (list of cached answers ranked by relevance, embedding cost in USD)
         """
         if not query or not query.strip():
             return [], 0.0
         
+        # 1. Generate query embedding (repeat questions reuse the in-process copy)
+        query_bytes, embedding_cost = await self.get_cached_embedding(query)
+        results = await self.search_with_vector(query, query_bytes, top_k=top_k)
+        return results, embedding_cost
+
+    async def search_batch(
+        self, queries: list[str], top_k: int = 5
+    ) -> tuple[list[list[dict]], float]:
+        """Hybrid search for several questions at once.
+
+        Questions missing from the query-vector cache are embedded in a single
+        embed_batch() call, and the Redis searches run concurrently.
+
+        Returns:
+            Tuple of (results per query in input order, total embedding cost in USD)
+        """
+        results: list[list[dict]] = [[] for _ in queries]
+        vectors: dict[str, bytes] = {}
+        misses: dict[str, str] = {}
+        for query in queries:
+            if not query or not query.strip():
+                continue
+            cache_key = query.strip().lower()
+            query_bytes = self._query_vectors.get(cache_key)
+            if query_bytes is not None:
+                self._query_vectors.move_to_end(cache_key)
+                vectors[cache_key] = query_bytes
+            else:
+                misses.setdefault(cache_key, query)
+
+        embedding_cost = 0.0
+        if misses:
+            embeddings = await self.embedding_service.embed_batch(list(misses.values()))
+            embedding_cost = self.embedding_service.get_cost_for_batch(len(misses))
+            for cache_key, embedding in zip(misses, embeddings):
+                vectors[cache_key] = self._remember_query_vector(
+                    cache_key, embedding.astype(np.float32).tobytes()
+                )
+
+        searched = [
+            (i, query) for i, query in enumerate(queries) if query and query.strip()
+        ]
+        found = await asyncio.gather(*(
+            self.search_with_vector(query, vectors[query.strip().lower()], top_k=top_k)
+            for _, query in searched
+        ))
+        for (i, _), hits in zip(searched, found):
+            results[i] = hits
+        return results, embedding_cost
+
+    async def get_cached_embedding(self, text: str) -> tuple[bytes, float]:
+        """Embed text as FLOAT32 bytes, reusing recent results for the same question.
+
+        Keys are normalized (stripped, lower-cased) so retries of a question
+        hit the cache; a hit costs nothing.
+
+        Returns:
+            Tuple of (vector bytes, embedding cost in USD)
+        """
+        cache_key = text.strip().lower()
+        query_bytes = self._query_vectors.get(cache_key)
+        if query_bytes is not None:
+            self._query_vectors.move_to_end(cache_key)
+            return query_bytes, 0.0
+
+        query_embedding = await self.embedding_service.embed(text)
+        query_bytes = self._remember_query_vector(
+            cache_key, query_embedding.astype(np.float32).tobytes()
+        )
+        return query_bytes, self.embedding_service.get_cost_per_embedding()
+
+    def _remember_query_vector(self, cache_key: str, query_bytes: bytes) -> bytes:
+        """Add a query vector to the LRU cache, evicting the oldest past capacity."""
+        self._query_vectors[cache_key] = query_bytes
+        if len(self._query_vectors) > self.QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_vectors.popitem(last=False)
+        return query_bytes
+
+    async def search_with_vector(
+        self, query: str, query_bytes: bytes, top_k: int = 5
+    ) -> list[dict]:
+        """Hybrid search with a precomputed query vector.
+
+        ``query`` is still needed for the BM25 half of the search.
+        """
         logger.debug(f"Searching cache for: {query[:100]}...")
         start_time = time.time()
         
-        # 1. Generate query embedding
-        query_embedding = await self.embedding_service.embed(query)
-        embedding_cost = self.embedding_service.get_cost_per_embedding()
-        query_bytes = query_embedding.astype(np.float32).tobytes()
-        
         # 2. Vector search (semantic similarity)
         vector_results = await self._vector_search(query_bytes, top_k=top_k * 2)
-        
+
+        # Near-exact hit: skip BM25 and fusion, return the single top document
+        if vector_results and vector_results[0]["score"] <= settings.cache_hit_threshold:
+            top = vector_results[0]
+            doc_json = (await self._fetch_documents([top["id"]]))[0]
+            if doc_json:
+                doc_json["relevance_score"] = 1.0 - top["score"]
+                elapsed = time.time() - start_time
+                logger.info(
+                    f"Hybrid search short-circuited on vector hit {top['id']} "
+                    f"(distance: {top['score']:.4f}) in {elapsed:.3f}s"
+                )
+                return [doc_json]
+
         # 3. Keyword search (BM25)
         keyword_results = await self._keyword_search(query, top_k=top_k * 2)
         
         # 4. Reciprocal Rank Fusion
         fused_items = self.rerank_fusion(vector_results, keyword_results, k=60)
         
-        # 5. Fetch and return top-k results
+        # 5. Fetch and return top-k results (one pipelined round-trip)
+        top_items = fused_items[:top_k]
+        documents = await self._fetch_documents([doc_id for doc_id, _ in top_items])
         results = []
-        for doc_id, score in fused_items[:top_k]:
-            try:
-                # Get full document from Redis
-                doc_key = f"{self.KEY_PREFIX}{doc_id}"
-                doc_json = await self.redis.json().get(doc_key)
-                if doc_json:
-                    doc_json["relevance_score"] = score
-                    results.append(doc_json)
-            except Exception as e:
-                logger.warning(f"Failed to fetch document {doc_id}: {e}")
-        
+        for (doc_id, score), doc_json in zip(top_items, documents):
+            if doc_json:
+                doc_json["relevance_score"] = score
+                results.append(doc_json)
+
         elapsed = time.time() - start_time
         logger.info(
             f"Hybrid search returned {len(results)} results in {elapsed:.3f}s "
             f"(vector: {len(vector_results)}, keyword: {len(keyword_results)})"
         )
         
-        return results, embedding_cost
+        return results
+
+    async def _fetch_documents(self, doc_ids: list[str]) -> list[dict | None]:
+        """Get documents from Redis by ID, without their embeddings.
+
+        The two 1536-float vectors are most of each document's JSON; search
+        callers only need the text and metadata. Recently fetched documents
+        come from an in-process LRU; the rest share one pipelined round-trip.
+        Missing or failed documents come back as None.
+        """
+        found: dict[str, dict] = {}
+        misses = []
+        for doc_id in doc_ids:
+            cached = self._documents.get(doc_id)
+            if cached is not None:
+                self._documents.move_to_end(doc_id)
+                found[doc_id] = cached
+            else:
+                misses.append(doc_id)
+
+        if misses:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for doc_id in misses:
+                        pipe.execute_command(
+                            "JSON.GET", f"{self.KEY_PREFIX}{doc_id}", *self.RESULT_PATHS
+                        )
+                    replies = await pipe.execute(raise_on_error=False)
+            except Exception as e:
+                logger.warning(f"Failed to fetch documents {misses}: {e}")
+                replies = [None] * len(misses)
+
+            for doc_id, fields in zip(misses, replies):
+                if isinstance(fields, Exception):
+                    logger.warning(f"Failed to fetch document {doc_id}: {fields}")
+                    continue
+                fields = _json_loads(fields)
+                if not fields:
+                    continue
+                document = {path[2:]: values[0] for path, values in fields.items() if values}
+                found[doc_id] = self._documents[doc_id] = document
+                if len(self._documents) > self.DOCUMENT_CACHE_SIZE:
+                    self._documents.popitem(last=False)
+
+        # Copies, since callers add a per-search relevance_score
+        return [dict(found[doc_id]) if doc_id in found else None for doc_id in doc_ids]
 
     async def _vector_search(self, query_bytes: bytes, top_k: int = 10) -> list[dict]:
         """Perform vector similarity search."""
@@ -146,7 +322,7 @@ class HybridKnowledgeBase:
             )
             
             params = {"vec": query_bytes}
-            result = await self.redis.ft(self.VECTOR_INDEX_NAME).search(query_obj, params)
+            result = await self.index.search(query_obj, params)
             
             # Convert to list of dicts with normalized structure
             hits = []
@@ -177,7 +353,7 @@ class HybridKnowledgeBase:
                 .dialect(2)
             )
             
-            result = await self.redis.ft(self.VECTOR_INDEX_NAME).search(query_obj)
+            result = await self.index.search(query_obj)
             
             # Convert to list of dicts
             hits = []
@@ -210,7 +386,7 @@ class HybridKnowledgeBase:
         Returns:
             Tuple of (document ID, embedding cost in USD)
         """
-        if not question or not answer:
+        if not question.strip() or not answer.strip():
             raise ValueError("Question and answer cannot be empty")
         
         logger.info(f"Storing cached answer for: {question[:100]}...")
@@ -222,18 +398,101 @@ class HybridKnowledgeBase:
         )
         embedding_cost = self.embedding_service.get_cost_for_batch(2)
         
-        # Create unique ID
-        doc_id = f"q_{uuid.uuid4().hex[:12]}"
+        doc_id, document = self._build_document(
+            question,
+            answer,
+            question_embedding,
+            answer_embedding,
+            approved_by=approved_by,
+            approval_timestamp=approval_timestamp,
+            human_modified=human_modified,
+            original_expert_answer=original_expert_answer,
+            category=category,
+        )
         doc_key = f"{self.KEY_PREFIX}{doc_id}"
         
-        # Prepare document
+        # Store in Redis as JSON
+        await self.redis.execute_command("JSON.SET", doc_key, "$", _json_dumps(document))
+        
+        elapsed = time.time() - start_time
+        logger.info(f"✓ Cached answer stored as {doc_id} in {elapsed:.3f}s")
+        
+        return doc_id, embedding_cost
+
+    async def store_many(
+        self, items: list[dict[str, Any]], approved_by: str
+    ) -> tuple[list[str], float]:
+        """Store several human-approved answers at once.
+
+        Each item holds ``question`` and ``answer`` plus any optional store()
+        keyword (``category``, ``human_modified``, ...). All questions and
+        answers are embedded in one embed_batch() call and the documents are
+        written in one pipelined round-trip.
+
+        Returns:
+            Tuple of (document IDs in input order, embedding cost in USD)
+        """
+        if not items:
+            return [], 0.0
+        # embed_batch() skips blank texts, which would shift every later
+        # item's embeddings onto the wrong document
+        if any(
+            not (item.get("question") or "").strip() or not (item.get("answer") or "").strip()
+            for item in items
+        ):
+            raise ValueError("Question and answer cannot be empty")
+
+        logger.info(f"Storing {len(items)} cached answers...")
+        start_time = time.time()
+
+        texts = [text for item in items for text in (item["question"], item["answer"])]
+        embeddings = await self.embedding_service.embed_batch(texts)
+        embedding_cost = self.embedding_service.get_cost_for_batch(len(texts))
+
+        doc_ids = []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for i, item in enumerate(items):
+                fields = {k: v for k, v in item.items() if k not in ("question", "answer")}
+                fields.setdefault("approved_by", approved_by)
+                doc_id, document = self._build_document(
+                    item["question"],
+                    item["answer"],
+                    embeddings[2 * i],
+                    embeddings[2 * i + 1],
+                    **fields,
+                )
+                pipe.execute_command(
+                    "JSON.SET", f"{self.KEY_PREFIX}{doc_id}", "$", _json_dumps(document)
+                )
+                doc_ids.append(doc_id)
+            await pipe.execute()
+
+        elapsed = time.time() - start_time
+        logger.info(f"✓ Stored {len(doc_ids)} cached answers in {elapsed:.3f}s")
+
+        return doc_ids, embedding_cost
+
+    @staticmethod
+    def _build_document(
+        question: str,
+        answer: str,
+        question_embedding: np.ndarray,
+        answer_embedding: np.ndarray,
+        approved_by: str,
+        approval_timestamp: str | None = None,
+        human_modified: bool = False,
+        original_expert_answer: str | None = None,
+        category: str = "general",
+    ) -> tuple[str, dict]:
+        """Build a new knowledge document. Returns (document ID, document)."""
+        doc_id = f"q_{uuid.uuid4().hex[:12]}"
         timestamp = approval_timestamp or datetime.utcnow().isoformat()
         document = {
             "id": doc_id,
             "question": question,
             "answer": answer,
-            "question_embedding": question_embedding.tolist(),
-            "answer_embedding": answer_embedding.tolist(),
+            "question_embedding": question_embedding,
+            "answer_embedding": answer_embedding,
             "metadata": {
                 "human_approved": True,
                 "approved_by": approved_by,
@@ -249,23 +508,21 @@ class HybridKnowledgeBase:
         if original_expert_answer:
             document["metadata"]["original_expert_answer"] = original_expert_answer
         
-        # Store in Redis as JSON
-        await self.redis.json().set(doc_key, "$", document)
-        
-        elapsed = time.time() - start_time
-        logger.info(f"✓ Cached answer stored as {doc_id} in {elapsed:.3f}s")
-        
-        return doc_id, embedding_cost
+        return doc_id, document
 
     def rerank_fusion(
-        self, vector_hits: list, keyword_hits: list, k: int = 60
+        self, vector_hits: list[dict], keyword_hits: list[dict], k: int = 60
     ) -> list[tuple[str, float]]:
-        """Reciprocal Rank Fusion over two result lists."""
+        """Reciprocal Rank Fusion over two result lists.
+
+        Both lists must hold the normalized dicts produced by
+        ``_vector_search`` / ``_keyword_search``.
+        """
         fused_scores: dict[str, float] = {}
         for rank, hit in enumerate(vector_hits):
-            hit_id = hit["id"] if isinstance(hit, dict) else hit.id
+            hit_id = hit["id"]
             fused_scores[hit_id] = fused_scores.get(hit_id, 0) + 1 / (k + rank)
         for rank, hit in enumerate(keyword_hits):
-            hit_id = hit["id"] if isinstance(hit, dict) else hit.id
+            hit_id = hit["id"]
             fused_scores[hit_id] = fused_scores.get(hit_id, 0) + 1 / (k + rank)
         return sorted(fused_scores.items(), key=lambda x: x[1], reverse=True)
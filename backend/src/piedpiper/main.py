@@ -1,14 +1,20 @@
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import time
 
+import asyncpg
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from openai import AsyncOpenAI
 from redis.asyncio import Redis
+from redis.commands.search.query import Query
 
 from piedpiper.api.routes import router as api_router
 from piedpiper.review.router import router as review_router
 from piedpiper.config import settings
-from piedpiper.infra.redis import EmbeddingService, HybridKnowledgeBase
+from piedpiper.infra.redis import EmbeddingService, HybridKnowledgeBase, get_client
+from piedpiper.review.queue import HumanReviewQueue
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +24,9 @@ class AppState:
     redis: Redis | None = None
     embedding_service: EmbeddingService | None = None
     knowledge_base: HybridKnowledgeBase | None = None
+    llm_client: AsyncOpenAI | None = None
+    pg_pool: asyncpg.Pool | None = None
+    review_queue: HumanReviewQueue | None = None
 
 
 app_state = AppState()
@@ -26,14 +35,16 @@ app_state = AppState()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown."""
+    # Eager tasks run synchronously until their first real suspension, so
+    # gather() children that finish without blocking skip a scheduler hop.
+    # Python 3.12+ only; older interpreters keep the default factory.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Startup: initialize connections
     logger.info("Initializing Redis connection...")
     try:
-        app_state.redis = Redis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=False,  # We'll handle encoding ourselves
-        )
+        app_state.redis = get_client()
         await app_state.redis.ping()
         logger.info(f"✓ Redis connected: {settings.redis_url}")
     except Exception as e:
@@ -48,6 +59,12 @@ async def lifespan(app: FastAPI):
     )
     logger.info("✓ Embedding service initialized")
 
+    # Shared W&B Inference client for all agents, so they reuse one connection pool
+    app_state.llm_client = AsyncOpenAI(
+        base_url=settings.wandb_base_url,
+        api_key=settings.wandb_api_key,
+    )
+
     # Initialize hybrid knowledge base
     logger.info("Initializing hybrid knowledge base...")
     app_state.knowledge_base = HybridKnowledgeBase(
@@ -55,14 +72,45 @@ async def lifespan(app: FastAPI):
         embedding_service=app_state.embedding_service,
     )
     
-    # Create search indices
-    try:
-        await app_state.knowledge_base.initialize_indices()
+    # Create search indices while the embedding client warms up; neither waits on the other
+    warmup_start = time.time()
+    index_result, embed_result = await asyncio.gather(
+        app_state.knowledge_base.initialize_indices(),
+        app_state.embedding_service.embed("warmup"),
+        return_exceptions=True,
+    )
+    if isinstance(index_result, Exception):
+        logger.warning(f"Failed to create search indices (may already exist): {index_result}")
+    else:
         logger.info("✓ Redis search indices created")
+
+    # Warm up the search index too, so the first request doesn't pay for either
+    try:
+        if isinstance(embed_result, Exception):
+            raise embed_result
+        await app_state.knowledge_base.index.search(Query("*").paging(0, 1))
+        logger.info(f"✓ Warmup completed in {time.time() - warmup_start:.3f}s")
     except Exception as e:
-        logger.warning(f"Failed to create search indices (may already exist): {e}")
+        logger.warning(f"Warmup failed: {e}")
     
-    # TODO: init Postgres, Weave
+    # Initialize Postgres pool and the review queue backed by it
+    logger.info("Initializing Postgres connection pool...")
+    try:
+        app_state.pg_pool = await asyncpg.create_pool(
+            settings.database_url.replace("+asyncpg", ""),
+            min_size=4,
+            max_size=32,
+            statement_cache_size=1024,
+        )
+        app_state.review_queue = HumanReviewQueue(pool=app_state.pg_pool)
+        await app_state.review_queue.initialize()
+        logger.info("✓ Postgres connected, review queue persisted")
+    except Exception as e:
+        logger.warning(f"Postgres unavailable, review queue stays in-memory: {e}")
+        app_state.review_queue = HumanReviewQueue()
+        await app_state.review_queue.initialize()
+
+    # TODO: init Weave
     
     yield
     
@@ -71,7 +119,14 @@ async def lifespan(app: FastAPI):
     if app_state.redis:
         await app_state.redis.close()
         logger.info("✓ Redis connection closed")
-    # TODO: cleanup Postgres, Weave
+    if app_state.llm_client:
+        await app_state.llm_client.close()
+    if app_state.review_queue:
+        await app_state.review_queue.close()
+    if app_state.pg_pool:
+        await app_state.pg_pool.close()
+        logger.info("✓ Postgres pool closed")
+    # TODO: cleanup Weave
 
 
 app = FastAPI(
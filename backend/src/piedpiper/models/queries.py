@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -25,6 +26,11 @@ class ExpertQuery(BaseModel):
     issue_type: IssueType = IssueType.DOCUMENTATION_GAP
     urgency_score: float = 0.0
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    # Filled in as the query moves through the workflow
+    searched: bool = False
+    cache_hit: bool = False
+    cache_results: list[dict[str, Any]] = Field(default_factory=list)
+    approved_by: str = ""
 
 
 class ExpertAnswer(BaseModel):
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import enum
+import sys
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class ReviewStatus(str, enum.Enum):
@@ -29,6 +30,12 @@ class ReviewItem(BaseModel):
     reviewer_id: str | None = None
     reviewed_at: datetime | None = None
 
+    @field_validator("arbiter_classification")
+    @classmethod
+    def _intern_classification(cls, v: str) -> str:
+        # Only a few issue types exist; share one string object per value
+        return sys.intern(v)
+
 
 class ReviewDecision(BaseModel):
     review_id: str
@@ -7,10 +7,26 @@ Changes to these models should be coordinated across the team.
 from __future__ import annotations
 
 import enum
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_serializer
+
+from piedpiper.models.queries import ExpertQuery
+
+# Only the most recent entries are needed for prompting
+MAX_CONVERSATION_HISTORY = 32
+MAX_ACTION_HISTORY = 256
+MAX_RECENT_ERRORS = 5
+
+
+def _bounded(maxlen: int) -> AfterValidator:
+    """Keep validated deques capped at maxlen, dropping the oldest entries."""
+    return AfterValidator(lambda v: v if v.maxlen == maxlen else deque(v, maxlen=maxlen))
 
 
 class WorkerExpertise(str, enum.Enum):
@@ -20,6 +36,8 @@ class WorkerExpertise(str, enum.Enum):
 
 
 class WorkerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     model: str
     expertise: WorkerExpertise
@@ -48,21 +66,37 @@ class Phase(str, enum.Enum):
     FAILED = "failed"
 
 
-class WorkerAction(BaseModel):
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+# Per-action records are internal and created in hot paths, so they are slotted
+# dataclasses rather than BaseModels; pydantic still validates them when nested.
+@dataclass(slots=True, frozen=True)
+class WorkerAction:
     action_type: str
     description: str
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     result: str | None = None
     error: str | None = None
 
+    def __post_init__(self):
+        # A handful of action types repeat across thousands of records
+        object.__setattr__(self, "action_type", sys.intern(self.action_type))
+
 
 class WorkerState(BaseModel):
+    # Mutated in place by graph nodes; assignments are trusted and not re-validated
+    model_config = ConfigDict(validate_assignment=False)
+
     worker_id: str
     config: WorkerConfig
     subtask: str = ""
-    conversation_history: list[dict[str, Any]] = Field(default_factory=list)
-    action_history: list[WorkerAction] = Field(default_factory=list)
-    recent_errors: list[str] = Field(default_factory=list)
+    conversation_history: Annotated[
+        deque[dict[str, Any]], _bounded(MAX_CONVERSATION_HISTORY)
+    ] = Field(default_factory=lambda: deque(maxlen=MAX_CONVERSATION_HISTORY))
+    action_history: Annotated[
+        deque[WorkerAction], _bounded(MAX_ACTION_HISTORY)
+    ] = Field(default_factory=lambda: deque(maxlen=MAX_ACTION_HISTORY))
+    recent_errors: Annotated[deque[str], _bounded(MAX_RECENT_ERRORS)] = Field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_ERRORS)
+    )
     llm_confidence: float = 1.0
     minutes_without_progress: float = 0.0
     sandbox_id: str | None = None
@@ -70,17 +104,30 @@ class WorkerState(BaseModel):
     completed: bool = False
     stuck: bool = False
 
+    @field_serializer("conversation_history", "action_history", "recent_errors")
+    def _history_as_list(self, history: deque) -> list:
+        return list(history)
 
-class CostEntry(BaseModel):
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+@dataclass(slots=True, frozen=True)
+class CostEntry:
     agent_type: str
     model: str
     tokens_in: int
     tokens_out: int
     cost_usd: float
+    timestamp: float = field(default_factory=time.time)  # seconds since epoch
+
+    def __post_init__(self):
+        # Share one string object per agent type / model name across all entries
+        object.__setattr__(self, "agent_type", sys.intern(self.agent_type))
+        object.__setattr__(self, "model", sys.intern(self.model))
 
 
 class CostTracker(BaseModel):
+    # Totals are bumped in place on every tracked call; assignments are not re-validated
+    model_config = ConfigDict(validate_assignment=False)
+
     entries: list[CostEntry] = Field(default_factory=list)
     spent_workers: float = 0.0
     spent_expert: float = 0.0
@@ -88,6 +135,17 @@ class CostTracker(BaseModel):
     spent_embeddings: float = 0.0
     spent_redis: float = 0.0
 
+    def add_entry(self, entry: CostEntry, bucket: str | None = None):
+        """Record an entry and add its cost to the matching spent_* total.
+
+        bucket defaults to entry.agent_type. Entries whose bucket has no
+        spent_* field are recorded without touching the totals.
+        """
+        self.entries.append(entry)
+        total = f"spent_{bucket or entry.agent_type}"
+        if total in type(self).model_fields:
+            setattr(self, total, getattr(self, total) + entry.cost_usd)
+
 
 class ExpertLearningLog(BaseModel):
     answer_ids: list[str] = Field(default_factory=list)
@@ -106,11 +164,20 @@ class FocusGroupState(BaseModel):
     This is the single source of truth passed between graph nodes.
     """
 
+    # LangGraph rebuilds this model from channel values before every node.
+    # Nested model instances are trusted as-is rather than re-validated, and
+    # in-place assignments from node code are not validated either.
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
     session_id: str = ""
     task: str = ""
     workers: list[WorkerState] = Field(default_factory=list)
+    # Maintained by the nodes that flip worker.completed / worker.stuck, so
+    # progress checks don't rescan every worker on each tick
+    completed_count: int = 0
+    stuck_count: int = 0
     current_phase: Phase = Phase.INIT
-    expert_queries: list[dict[str, Any]] = Field(default_factory=list)
+    expert_queries: list[ExpertQuery] = Field(default_factory=list)
     costs: CostTracker = Field(default_factory=CostTracker)
     shared_memory: SharedMemory = Field(default_factory=SharedMemory)
     expert_learning: ExpertLearningLog = Field(default_factory=ExpertLearningLog)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
-class ValidationCheck(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationCheck:
     name: str
     passed: bool
     error: str | None = None
-    details: dict[str, Any] = Field(default_factory=dict)
+    details: dict[str, Any] = field(default_factory=dict)
 
 
 class ValidationResult(BaseModel):
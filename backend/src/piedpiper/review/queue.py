@@ -4,46 +4,193 @@ Owner: Person 3 (Infrastructure)
 
 Manages the queue of questions awaiting human review.
 Integrates with the Next.js dashboard via FastAPI endpoints.
+
+Items are served from memory. When an asyncpg pool is supplied, they are
+also persisted to the ``review_items`` table: single submissions go through
+a write-behind buffer that is flushed in batches, bursts via submit_many()
+are inserted in one transaction.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any
 
 from piedpiper.models.queries import ExpertQuery
 from piedpiper.models.review import ReviewDecision, ReviewItem, ReviewStatus
 
+logger = logging.getLogger(__name__)
+
+# Enum members are singletons, so status checks compare by identity
+_PENDING = ReviewStatus.PENDING
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS review_items (
+    id TEXT PRIMARY KEY,
+    timestamp TIMESTAMP NOT NULL,
+    question TEXT NOT NULL,
+    worker_id TEXT NOT NULL,
+    worker_context TEXT NOT NULL DEFAULT '',
+    arbiter_urgency DOUBLE PRECISION NOT NULL DEFAULT 0,
+    arbiter_classification TEXT NOT NULL DEFAULT '',
+    similar_cached JSONB NOT NULL DEFAULT '[]',
+    status TEXT NOT NULL,
+    reviewer_id TEXT,
+    reviewed_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS review_items_status_idx ON review_items (status);
+"""
+
+_COLUMNS = (
+    "id, timestamp, question, worker_id, worker_context, arbiter_urgency, "
+    "arbiter_classification, similar_cached, status, reviewer_id, reviewed_at"
+)
+
+_INSERT_SQL = f"""
+INSERT INTO review_items ({_COLUMNS})
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+ON CONFLICT (id) DO NOTHING
+"""
+
+_UPSERT_SQL = f"""
+INSERT INTO review_items ({_COLUMNS})
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+ON CONFLICT (id) DO UPDATE SET
+    status = EXCLUDED.status,
+    reviewer_id = EXCLUDED.reviewer_id,
+    reviewed_at = EXCLUDED.reviewed_at
+"""
+
+_SELECT_PENDING_SQL = f"""
+SELECT {_COLUMNS} FROM review_items WHERE status = $1 ORDER BY timestamp
+"""
+
 
 class HumanReviewQueue:
-    """In-memory review queue (will be backed by Postgres in production)."""
+    """Review queue held in memory, optionally persisted to Postgres."""
+
+    FLUSH_BATCH_SIZE = 500
+    FLUSH_INTERVAL_SECONDS = 0.05
+    # A failed batch is retried with exponential backoff, up to this many
+    # attempts per item before the item is logged and dropped from the buffer
+    FLUSH_MAX_ATTEMPTS = 5
+    FLUSH_MAX_BACKOFF_SECONDS = 5.0
+    JANITOR_INTERVAL_SECONDS = 60
+    DECIDED_RETENTION = timedelta(hours=24)
 
-    def __init__(self):
+    def __init__(self, pool: Any | None = None):
         self._queue: dict[str, ReviewItem] = {}
-        self._pending_futures: dict[str, object] = {}  # for async wait
+        # IDs of items still awaiting review, in submission order
+        self._pending_ids: dict[str, None] = {}
+        # Snapshot of _queue.values() for get_all(), rebuilt after membership changes
+        self._all_cache: list[ReviewItem] | None = None
+        # Wake-up events for workflow nodes blocked in wait_for_decision()
+        self._events: dict[str, asyncio.Event] = {}
+        self._decisions: dict[str, ReviewDecision] = {}
+        self._pool = pool
+        self._write_buffer: asyncio.Queue[ReviewItem] = asyncio.Queue()
+        # Failed flush attempts per buffered item
+        self._write_attempts: dict[str, int] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._janitor_task: asyncio.Task | None = None
+
+    async def initialize(self):
+        """Start background tasks; with a pool, also create the table and reload pending items.
+
+        Call once on startup.
+        """
+        self._janitor_task = asyncio.create_task(self._janitor_loop())
+        if self._pool is None:
+            return
+
+        async with self._pool.acquire() as conn:
+            await conn.execute(_CREATE_TABLE_SQL)
+            rows = await conn.fetch(_SELECT_PENDING_SQL, _PENDING.value)
+
+        for row in rows:
+            self._register(self._from_row(row))
+        logger.info(f"Loaded {len(rows)} pending review items from Postgres")
+
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        """Stop background tasks and write out anything still buffered.
+
+        A batch the flush loop was writing when cancelled goes back on the
+        buffer, so it is part of the final write.
+        """
+        for task in (self._flush_task, self._janitor_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = self._janitor_task = None
+
+        batch = []
+        while not self._write_buffer.empty():
+            batch.append(self._write_buffer.get_nowait())
+        if batch:
+            await self._insert_many(batch)
 
     async def submit(self, query: ExpertQuery, arbiter_context: dict) -> str:
         """Submit a question for human review. Returns review_id."""
-        review_id = str(uuid.uuid4())
-        item = ReviewItem(
-            id=review_id,
-            timestamp=datetime.utcnow(),
-            question=query.question,
-            worker_id=query.worker_id,
-            worker_context=query.worker_context,
-            arbiter_urgency=arbiter_context.get("urgency_score", 0.0),
-            arbiter_classification=arbiter_context.get("issue_type", ""),
-            status=ReviewStatus.PENDING,
-        )
-        self._queue[review_id] = item
-        return review_id
+        item = self._build_item(query, arbiter_context, datetime.utcnow())
+        self._register(item)
+        if self._pool is not None:
+            self._write_buffer.put_nowait(item)
+        return item.id
+
+    async def submit_many(
+        self, queries: list[ExpertQuery], arbiter_contexts: list[dict]
+    ) -> list[str]:
+        """Submit a burst of questions, persisted in a single transaction.
+
+        Returns the review_ids in input order.
+        """
+        # One clock read for the whole burst
+        now = datetime.utcnow()
+        items = [
+            self._build_item(query, ctx, now) for query, ctx in zip(queries, arbiter_contexts)
+        ]
+        for item in items:
+            self._register(item)
+        if self._pool is not None and items:
+            await self._insert_many(items)
+        return [item.id for item in items]
 
     async def get_pending(self) -> list[ReviewItem]:
         """Get all pending review items."""
-        return [
-            item for item in self._queue.values()
-            if item.status == ReviewStatus.PENDING
-        ]
+        return [self._queue[review_id] for review_id in self._pending_ids]
+
+    async def wait_for_decision(
+        self, review_id: str, timeout: float
+    ) -> ReviewDecision | None:
+        """Block until a reviewer decides on review_id.
+
+        Returns the decision, or None if none arrives within timeout seconds.
+        """
+        if review_id not in self._queue:
+            raise ValueError(f"Review item {review_id} not found")
+
+        try:
+            if review_id not in self._decisions:
+                event = self._events.setdefault(review_id, asyncio.Event())
+                # asyncio.timeout reschedules the current task instead of
+                # wrapping the wait in a new one like asyncio.wait_for
+                async with asyncio.timeout(timeout):
+                    await event.wait()
+            return self._decisions.get(review_id)
+        except TimeoutError:
+            return None
+        finally:
+            self._events.pop(review_id, None)
+            self._decisions.pop(review_id, None)
 
     async def get_item(self, review_id: str) -> ReviewItem | None:
         """Get a specific review item."""
@@ -51,7 +198,9 @@ class HumanReviewQueue:
 
     async def get_all(self) -> list[ReviewItem]:
         """Get all review items."""
-        return list(self._queue.values())
+        if self._all_cache is None:
+            self._all_cache = list(self._queue.values())
+        return self._all_cache
 
     async def process_decision(self, decision: ReviewDecision):
         """Process a human reviewer's decision."""
@@ -59,11 +208,197 @@ class HumanReviewQueue:
         if not item:
             raise ValueError(f"Review item {decision.review_id} not found")
 
-        item.status = decision.decision
-        item.reviewer_id = decision.reviewer_id
-        item.reviewed_at = datetime.utcnow()
+        self._apply_decision(item, decision, datetime.utcnow())
+        event = self._events.get(decision.review_id)
+        if event:
+            event.set()
+
+        if self._pool is not None:
+            # Upsert so the decision lands even if the insert is still buffered
+            async with self._pool.acquire() as conn:
+                await conn.execute(_UPSERT_SQL, *self._to_row(item))
 
         # TODO: trigger downstream actions based on decision
         # - approved → expert_answer
         # - rejected → notify worker
         # - modified → store corrected answer + notify worker
+
+    async def process_decisions(self, decisions: list[ReviewDecision]):
+        """Process a bulk decision (e.g. "approve all matching").
+
+        All items are updated before any waiter is woken, and the rows are
+        upserted in one transaction. Unknown review IDs are skipped.
+        """
+        now = datetime.utcnow()
+        updated: list[ReviewItem] = []
+        to_wake: list[asyncio.Event] = []
+        for decision in decisions:
+            item = self._queue.get(decision.review_id)
+            if not item:
+                logger.warning(f"Review item {decision.review_id} not found, skipping")
+                continue
+            self._apply_decision(item, decision, now)
+            updated.append(item)
+            event = self._events.get(decision.review_id)
+            if event:
+                to_wake.append(event)
+
+        for event in to_wake:
+            event.set()
+
+        if self._pool is not None and updated:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(_UPSERT_SQL, [self._to_row(i) for i in updated])
+
+    def _apply_decision(self, item: ReviewItem, decision: ReviewDecision, now: datetime):
+        item.status = decision.decision
+        if item.status is not _PENDING:
+            self._pending_ids.pop(decision.review_id, None)
+        item.reviewer_id = decision.reviewer_id
+        item.reviewed_at = now
+        self._decisions[decision.review_id] = decision
+
+    def _build_item(
+        self, query: ExpertQuery, arbiter_context: dict, timestamp: datetime
+    ) -> ReviewItem:
+        return ReviewItem(
+            id=str(uuid.uuid4()),
+            timestamp=timestamp,
+            question=query.question,
+            worker_id=query.worker_id,
+            worker_context=query.worker_context,
+            arbiter_urgency=arbiter_context.get("urgency_score", 0.0),
+            arbiter_classification=arbiter_context.get("issue_type", ""),
+            status=_PENDING,
+        )
+
+    def _register(self, item: ReviewItem):
+        self._queue[item.id] = item
+        self._pending_ids[item.id] = None
+        self._all_cache = None
+
+    async def _flush_loop(self):
+        """Drain the write buffer in batches of up to FLUSH_BATCH_SIZE items.
+
+        Polls with get_nowait() and sleeps FLUSH_INTERVAL_SECONDS when the
+        buffer is empty, instead of arming a wait_for() timeout per item.
+        A failed batch goes back on the buffer and the loop backs off.
+        """
+        failures = 0
+        while True:
+            batch: list[ReviewItem] = []
+            try:
+                while len(batch) < self.FLUSH_BATCH_SIZE:
+                    batch.append(self._write_buffer.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+            if batch:
+                try:
+                    await self._insert_many(batch)
+                except asyncio.CancelledError:
+                    # close() writes the buffer out; the rolled-back (or, if
+                    # it committed, conflict-ignored) batch is written again
+                    self._requeue(batch)
+                    raise
+                except Exception as e:
+                    failures += 1
+                    self._retry_later(batch, e)
+                    await asyncio.sleep(
+                        min(
+                            self.FLUSH_INTERVAL_SECONDS * 2**failures,
+                            self.FLUSH_MAX_BACKOFF_SECONDS,
+                        )
+                    )
+                    continue
+                failures = 0
+                for item in batch:
+                    self._write_attempts.pop(item.id, None)
+            if self._write_buffer.empty():
+                await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+
+    def _requeue(self, batch: list[ReviewItem]):
+        for item in batch:
+            self._write_buffer.put_nowait(item)
+
+    def _retry_later(self, batch: list[ReviewItem], error: Exception):
+        """Put a failed batch back on the buffer, dropping items out of attempts."""
+        retry: list[ReviewItem] = []
+        for item in batch:
+            attempts = self._write_attempts.get(item.id, 0) + 1
+            if attempts < self.FLUSH_MAX_ATTEMPTS:
+                self._write_attempts[item.id] = attempts
+                retry.append(item)
+            else:
+                self._write_attempts.pop(item.id, None)
+                logger.error(
+                    f"Giving up on persisting review item {item.id} "
+                    f"after {attempts} attempts: {error}"
+                )
+        self._requeue(retry)
+        logger.warning(
+            f"Failed to persist {len(batch)} review items, retrying {len(retry)}: {error}"
+        )
+
+    async def _janitor_loop(self):
+        """Periodically evict decided items older than DECIDED_RETENTION."""
+        while True:
+            await asyncio.sleep(self.JANITOR_INTERVAL_SECONDS)
+            evicted = self._evict_decided(datetime.utcnow() - self.DECIDED_RETENTION)
+            if evicted:
+                logger.debug(f"Evicted {evicted} decided review items from memory")
+
+    def _evict_decided(self, cutoff: datetime) -> int:
+        """Drop decided items reviewed before cutoff. Returns the number evicted.
+
+        Persisted rows are untouched; this only bounds in-memory growth.
+        """
+        expired = [
+            review_id
+            for review_id, item in self._queue.items()
+            if item.status is not _PENDING and (item.reviewed_at or item.timestamp) < cutoff
+        ]
+        for review_id in expired:
+            del self._queue[review_id]
+            self._decisions.pop(review_id, None)
+        if expired:
+            self._all_cache = None
+        return len(expired)
+
+    async def _insert_many(self, items: list[ReviewItem]):
+        rows = [self._to_row(item) for item in items]
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(_INSERT_SQL, rows)
+
+    @staticmethod
+    def _to_row(item: ReviewItem) -> tuple:
+        return (
+            item.id,
+            item.timestamp,
+            item.question,
+            item.worker_id,
+            item.worker_context,
+            item.arbiter_urgency,
+            item.arbiter_classification,
+            json.dumps(item.similar_cached),
+            item.status.value,
+            item.reviewer_id,
+            item.reviewed_at,
+        )
+
+    @staticmethod
+    def _from_row(row: Any) -> ReviewItem:
+        return ReviewItem(
+            id=row["id"],
+            timestamp=row["timestamp"],
+            question=row["question"],
+            worker_id=row["worker_id"],
+            worker_context=row["worker_context"],
+            arbiter_urgency=row["arbiter_urgency"],
+            arbiter_classification=row["arbiter_classification"],
+            similar_cached=json.loads(row["similar_cached"]),
+            status=ReviewStatus(row["status"]),
+            reviewer_id=row["reviewer_id"],
+            reviewed_at=row["reviewed_at"],
+        )
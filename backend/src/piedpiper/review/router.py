@@ -7,49 +7,58 @@ These endpoints power the Next.js review dashboard.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from piedpiper.models.review import ReviewDecision, ReviewItem
 from piedpiper.review.queue import HumanReviewQueue
 
+# Routes declare response_model, so FastAPI serializes them with pydantic-core
 router = APIRouter(tags=["review"])
 
-# Singleton queue instance (will be injected via dependency in production)
+# Only reached when the app lifespan hasn't run (tests, scripts). The lifespan
+# always sets app_state.review_queue, in memory itself if Postgres is down.
 _queue = HumanReviewQueue()
 
 
 def get_queue() -> HumanReviewQueue:
-    return _queue
+    """Return the queue the lifespan created, or the module-level one without a lifespan."""
+    from piedpiper.main import app_state
+
+    return app_state.review_queue or _queue
 
 
 @router.get("/items", response_model=list[ReviewItem])
-async def list_review_items():
+async def list_review_items(queue: HumanReviewQueue = Depends(get_queue)):
     """List all review items."""
-    return await get_queue().get_all()
+    return await queue.get_all()
 
 
 @router.get("/items/pending", response_model=list[ReviewItem])
-async def list_pending_items():
+async def list_pending_items(queue: HumanReviewQueue = Depends(get_queue)):
     """List pending review items."""
-    return await get_queue().get_pending()
+    return await queue.get_pending()
 
 
 @router.get("/items/{review_id}", response_model=ReviewItem)
-async def get_review_item(review_id: str):
+async def get_review_item(review_id: str, queue: HumanReviewQueue = Depends(get_queue)):
     """Get a specific review item."""
-    item = await get_queue().get_item(review_id)
+    item = await queue.get_item(review_id)
     if not item:
         raise HTTPException(status_code=404, detail="Review item not found")
     return item
 
 
 @router.post("/items/{review_id}/decide")
-async def submit_decision(review_id: str, decision: ReviewDecision):
+async def submit_decision(
+    review_id: str,
+    decision: ReviewDecision,
+    queue: HumanReviewQueue = Depends(get_queue),
+):
     """Submit a review decision (approve/reject/modify)."""
     if decision.review_id != review_id:
         raise HTTPException(status_code=400, detail="Review ID mismatch")
     try:
-        await get_queue().process_decision(decision)
+        await queue.process_decision(decision)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     return {"status": "ok"}
@@ -17,10 +17,13 @@ INIT → ASSIGN_TASK → WORKER_EXECUTE → CHECK_PROGRESS
     → EXPERT_LEARN
 """
 
+import functools
+
 from langgraph.graph import END, StateGraph
 
 from piedpiper.models.state import FocusGroupState
 from piedpiper.workflow.nodes import (
+    CACHE_HIT_SCORE,
     arbiter_node,
     assign_task_node,
     browserbase_test_node,
@@ -35,8 +38,13 @@ from piedpiper.workflow.nodes import (
 )
 
 
+@functools.lru_cache(maxsize=1)
 def build_graph() -> StateGraph:
-    """Build and compile the focus group workflow graph."""
+    """Build and compile the focus group workflow graph.
+
+    The compiled graph holds no per-session state, so it is built once and
+    shared by every caller.
+    """
     graph = StateGraph(FocusGroupState)
 
     # Add nodes
@@ -72,8 +80,15 @@ def build_graph() -> StateGraph:
         },
     )
 
-    # Arbiter → hybrid search
-    graph.add_edge("arbiter", "hybrid_search")
+    # Conditional: arbiter → hybrid search if it escalated a question, else back to worker
+    graph.add_conditional_edges(
+        "arbiter",
+        _route_after_arbiter,
+        {
+            "escalate": "hybrid_search",
+            "no_query": "worker_execute",
+        },
+    )
 
     # Conditional: hybrid_search → cache hit goes back to worker, miss goes to human review
     graph.add_conditional_edges(
@@ -85,29 +100,17 @@ def build_graph() -> StateGraph:
         },
     )
 
-    # Conditional: human_review → approved goes to expert, rejected goes back to worker
-    graph.add_conditional_edges(
-        "human_review",
-        _route_after_review,
-        {
-            "approved": "expert_answer",
-            "rejected": "worker_execute",
-            "modified": "worker_execute",
-        },
-    )
+    # Human review → expert answer. Reviews are always treated as approved
+    # for now; restore a conditional edge (rejected/modified → worker_execute)
+    # once review decisions feed back into the state.
+    graph.add_edge("human_review", "expert_answer")
 
     # Expert answer → back to worker
     graph.add_edge("expert_answer", "worker_execute")
 
-    # Conditional: browserbase_test → pass to report, fail to retry
-    graph.add_conditional_edges(
-        "browserbase_test",
-        _route_after_test,
-        {
-            "pass": "generate_report",
-            "fail": "worker_execute",
-        },
-    )
+    # Browserbase test → report. Tests always pass for now; restore a
+    # conditional edge (fail → worker_execute) once results are recorded.
+    graph.add_edge("browserbase_test", "generate_report")
 
     # Report → learn → end
     graph.add_edge("generate_report", "expert_learn")
@@ -117,33 +120,43 @@ def build_graph() -> StateGraph:
 
 
 def _route_after_progress_check(state: FocusGroupState) -> str:
-    """Route based on worker progress."""
-    # Check if all workers completed
-    all_completed = all(worker.completed for worker in state.workers)
-    if all_completed:
-        return "success"
-    
-    # Check if any worker is stuck
-    any_stuck = any(worker.stuck for worker in state.workers)
-    if any_stuck:
+    """Route based on worker progress.
+
+    Reads the counters kept on the state; a stuck worker takes priority
+    over completion.
+    """
+    if state.stuck_count:
         return "stuck"
-    
+    if state.completed_count == len(state.workers):
+        return "success"
     return "continue"
 
 
-def _route_after_search(state: FocusGroupState) -> str:
-    """Route based on cache hit/miss."""
-    # For now, always return cache miss (no Redis implementation yet)
-    return "cache_miss"
-
+def _route_after_arbiter(state: FocusGroupState) -> str:
+    """Skip search and review entirely when there is no new question to answer.
 
-def _route_after_review(state: FocusGroupState) -> str:
-    """Route based on human review decision."""
-    # For now, assume approved (no human review implementation yet)
-    return "approved"
+    Earlier questions stay in expert_queries after they are searched, so only
+    an unsearched last query counts as a new escalation.
+    """
+    queries = state.expert_queries
+    return "escalate" if queries and not queries[-1].searched else "no_query"
 
 
-def _route_after_test(state: FocusGroupState) -> str:
-    """Route based on browserbase test result."""
-    # For now, always pass (no browserbase implementation yet)
-    return "pass"
+def _route_after_search(state: FocusGroupState) -> str:
+    """Route based on cache hit/miss.
+
+    Only a confident top result (relevance above CACHE_HIT_SCORE, i.e. the
+    near-exact vector short-circuit in HybridKnowledgeBase.search) goes
+    straight back to the worker; fused results still go to human review.
+    hybrid_search_node reports the matching phase.
+    """
+    queries = state.expert_queries
+    if not queries:
+        return "cache_miss"
+    current = queries[-1]
+    if not current.cache_hit:
+        return "cache_miss"
+    results = current.cache_results
+    if results and results[0].get("relevance_score", 0) > CACHE_HIT_SCORE:
+        return "cache_hit"
+    return "cache_miss"
@@ -3,29 +3,74 @@
 Owner: Person 1 (Core Workflow)
 
 Each node receives FocusGroupState, performs its work, and returns
-updated state. Nodes call into agents/ and infra/ modules but don't
-implement agent or infrastructure logic themselves.
+updated state. Workers are updated in place, so nodes only return
+``workers`` when they replace the list. Nodes call into agents/ and
+infra/ modules but don't implement agent or infrastructure logic
+themselves.
 """
 
-import logging
-
-from piedpiper.models.state import FocusGroupState, Phase
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 from uuid import uuid4
 
-from piedpiper.models.state import (
-    DEFAULT_WORKERS,
-    FocusGroupState,
-    Phase,
-    WorkerExpertise,
-    WorkerState,
-)
+from piedpiper.agents.arbiter import ArbiterAgent
 from piedpiper.agents.worker import WorkerAgent
 from piedpiper.config import settings
+from piedpiper.models.queries import ExpertQuery
+from piedpiper.models.state import DEFAULT_WORKERS, FocusGroupState, Phase, WorkerState
 
 logger = logging.getLogger(__name__)
 
+# Caps concurrent per-worker calls to Daytona / the LLM API across sessions
+_worker_slots = asyncio.Semaphore(settings.worker_concurrency)
+
+# Stateless; only its stuck-detection signals are used here
+_arbiter = ArbiterAgent()
+
+# One WorkerAgent per (session_id, worker_id), kept for the session's lifetime
+# so its sandbox handle and OpenAI client are reused across graph ticks
+_agents: dict[tuple[str, str], WorkerAgent] = {}
+
+# Top-result relevance above which a cache hit goes straight back to the
+# worker instead of through human review (see _route_after_search)
+CACHE_HIT_SCORE = 0.7
+
+
+@functools.cache
+def _app_state():
+    """Resolve piedpiper.main.app_state once.
+
+    Imported lazily so that loading the workflow doesn't build the FastAPI app.
+    """
+    from piedpiper.main import app_state
+
+    return app_state
+
+
+def _get_agent(session_id: str, worker: WorkerState) -> WorkerAgent:
+    """Return the session's agent for worker, creating it on first use."""
+    app_state = _app_state()
+    key = (session_id, worker.worker_id)
+    agent = _agents.get(key)
+    if agent is None:
+        agent = _agents[key] = WorkerAgent(worker.config, client=app_state.llm_client)
+        agent.sandbox_id = worker.sandbox_id
+    return agent
+
+
+async def _provision_sandbox(session_id: str, worker: WorkerState) -> str:
+    async with _worker_slots:
+        return await _get_agent(session_id, worker).initialize_sandbox()
+
+
+def _release_agents(session_id: str):
+    """Drop all cached agents for a finished session."""
+    for key in [key for key in _agents if key[0] == session_id]:
+        del _agents[key]
+
 
 async def init_node(state: FocusGroupState) -> dict:
     """Initialize workers and reset state."""
@@ -34,24 +79,43 @@ async def init_node(state: FocusGroupState) -> dict:
         state.session_id = str(uuid4())
     
     # Create WorkerState for each DEFAULT_WORKERS config
-    workers = []
-    for config in DEFAULT_WORKERS:
-        worker_state = WorkerState(
-            worker_id=config.id,
-            config=config,
-        )
-        
-        # Initialize Daytona sandbox for this worker
-        agent = WorkerAgent(config)
-        sandbox_id = await agent.initialize_sandbox()
-        worker_state.sandbox_id = sandbox_id
-        
-        workers.append(worker_state)
+    workers = [
+        # Trusted internal construction: skip validation
+        WorkerState.model_construct(worker_id=config.id, config=config)
+        for config in DEFAULT_WORKERS
+    ]
+
+    # Initialize Daytona sandboxes for all workers concurrently
+    sandbox_ids = await asyncio.gather(
+        *(_provision_sandbox(state.session_id, worker) for worker in workers),
+        return_exceptions=True,
+    )
+    # A worker whose sandbox failed is finished with an error so it drops out
+    # of execution; the run only aborts if no sandbox came up at all
+    errors = []
+    for worker, sandbox_id in zip(workers, sandbox_ids):
+        if isinstance(sandbox_id, Exception):
+            logger.error("Sandbox init failed for worker %s: %s", worker.worker_id, sandbox_id)
+            errors.append(sandbox_id)
+            worker.recent_errors.append(str(sandbox_id))
+            worker.completed = True
+            worker.output = {"status": "failed", "error": f"Sandbox init failed: {sandbox_id}"}
+        else:
+            worker.sandbox_id = sandbox_id
+    if len(errors) == len(workers):
+        _release_agents(state.session_id)
+        raise errors[0]
     
     state.workers = workers
     state.current_phase = Phase.ASSIGN_TASK
     
-    return {"workers": workers, "current_phase": Phase.ASSIGN_TASK}
+    return {
+        "session_id": state.session_id,
+        "workers": workers,
+        "completed_count": len(errors),
+        "stuck_count": 0,
+        "current_phase": Phase.ASSIGN_TASK,
+    }
 
 
 async def assign_task_node(state: FocusGroupState) -> dict:
@@ -62,7 +126,7 @@ async def assign_task_node(state: FocusGroupState) -> dict:
 
     state.current_phase = Phase.WORKER_EXECUTE
     
-    return {"workers": state.workers, "current_phase": Phase.WORKER_EXECUTE}
+    return {"current_phase": Phase.WORKER_EXECUTE}
 
 
 async def worker_execute_node(state: FocusGroupState) -> dict:
@@ -70,19 +134,51 @@ async def worker_execute_node(state: FocusGroupState) -> dict:
 
     Delegates to agents.worker.execute()
     """
-    # For now, just mark all workers as completed (stub implementation)
-    # TODO: actually call WorkerAgent.execute_subtask() for each worker
-    for worker in state.workers:
-        if not worker.completed:
-            # Placeholder: mark as completed for now
-            worker.completed = True
-            worker.output = {
-                "status": "completed",
-                "result": f"Stub result for {worker.worker_id}",
-            }
+    # Unfinished workers run concurrently; results are merged back afterwards
+    pending = [worker for worker in state.workers if not worker.completed]
+    outputs = await asyncio.gather(
+        *(_execute_worker(state.session_id, worker) for worker in pending),
+        return_exceptions=True,
+    )
+    for worker, output in zip(pending, outputs):
+        if isinstance(output, Exception):
+            logger.error("Worker %s execution failed: %s", worker.worker_id, output)
+            worker.recent_errors.append(str(output))
+            continue
+        _set_completed(state, worker)
+        worker.output = output
     
     state.current_phase = Phase.CHECK_PROGRESS
-    return {"workers": state.workers, "current_phase": Phase.CHECK_PROGRESS}
+    return {
+        "completed_count": state.completed_count,
+        "current_phase": Phase.CHECK_PROGRESS,
+    }
+
+
+def _set_completed(state: FocusGroupState, worker: WorkerState):
+    """Mark worker completed, keeping state.completed_count (and stuck_count) in step."""
+    if not worker.completed:
+        worker.completed = True
+        state.completed_count += 1
+    _set_stuck(state, worker, False)
+
+
+def _set_stuck(state: FocusGroupState, worker: WorkerState, stuck: bool):
+    """Set worker.stuck, keeping state.stuck_count in step."""
+    if worker.stuck != stuck:
+        worker.stuck = stuck
+        state.stuck_count += 1 if stuck else -1
+
+
+async def _execute_worker(session_id: str, worker: WorkerState) -> dict:
+    """Run one worker's subtask and return its output."""
+    async with _worker_slots:
+        # TODO: actually call WorkerAgent.execute_subtask() via _get_agent(session_id, worker)
+        # Placeholder: report completion for now (stub implementation)
+        return {
+            "status": "completed",
+            "result": f"Stub result for {worker.worker_id}",
+        }
 
 
 async def check_progress_node(state: FocusGroupState) -> dict:
@@ -90,24 +186,30 @@ async def check_progress_node(state: FocusGroupState) -> dict:
 
     Updates worker.stuck and worker.minutes_without_progress.
     """
+    # Flag newly stuck workers; finished or already-flagged ones need no look
+    for worker in state.workers:
+        if not worker.completed and not worker.stuck:
+            if _arbiter.should_escalate(worker)[0]:
+                _set_stuck(state, worker, True)
+
+    # Check for stuck workers first; same priority as _route_after_progress_check
+    any_stuck = state.stuck_count > 0
+    
+    if any_stuck:
+        state.current_phase = Phase.ARBITER
+        return {"stuck_count": state.stuck_count, "current_phase": Phase.ARBITER}
+    
     # Check if all workers are completed
-    all_completed = all(worker.completed for worker in state.workers)
+    all_completed = state.completed_count == len(state.workers)
     
     if all_completed:
         # All done, move to browserbase test
         state.current_phase = Phase.BROWSERBASE_TEST
-        return {"workers": state.workers, "current_phase": Phase.BROWSERBASE_TEST}
-    
-    # Check for stuck workers
-    any_stuck = any(worker.stuck for worker in state.workers)
-    
-    if any_stuck:
-        state.current_phase = Phase.ARBITER
-        return {"workers": state.workers, "current_phase": Phase.ARBITER}
+        return {"current_phase": Phase.BROWSERBASE_TEST}
     
     # Workers still executing
     state.current_phase = Phase.WORKER_EXECUTE
-    return {"workers": state.workers, "current_phase": Phase.WORKER_EXECUTE}
+    return {"current_phase": Phase.WORKER_EXECUTE}
 
 
 async def arbiter_node(state: FocusGroupState) -> dict:
@@ -118,10 +220,16 @@ async def arbiter_node(state: FocusGroupState) -> dict:
     # Stub: mark stuck workers as unstuck and continue
     for worker in state.workers:
         if worker.stuck:
-            worker.stuck = False
+            _set_stuck(state, worker, False)
     
-    state.current_phase = Phase.HYBRID_SEARCH
-    return {"workers": state.workers, "current_phase": Phase.HYBRID_SEARCH}
+    # Same condition as _route_after_arbiter: only a new question is searched
+    queries = state.expert_queries
+    escalated = bool(queries) and not queries[-1].searched
+    state.current_phase = Phase.HYBRID_SEARCH if escalated else Phase.WORKER_EXECUTE
+    return {
+        "stuck_count": state.stuck_count,
+        "current_phase": state.current_phase,
+    }
 
 
 async def hybrid_search_node(state: FocusGroupState) -> dict:
@@ -129,8 +237,6 @@ async def hybrid_search_node(state: FocusGroupState) -> dict:
 
     Delegates to infra.search.hybrid_search()
     """
-    from piedpiper.main import app_state
-    
     # Get the current expert query (should be added by arbiter_node)
     if not state.expert_queries:
         logger.warning("No expert queries to search for")
@@ -138,54 +244,72 @@ async def hybrid_search_node(state: FocusGroupState) -> dict:
     
     # Get the most recent query
     current_query = state.expert_queries[-1]
-    question = current_query.get("question", "")
+    question = current_query.question
     
     if not question:
         logger.warning("Expert query has no question")
         return {"current_phase": Phase.HUMAN_REVIEW}
     
-    logger.info(f"Searching cache for: {question[:100]}...")
+    # A retry of the previous question reuses its results without a lookup
+    if len(state.expert_queries) > 1:
+        previous = state.expert_queries[-2]
+        if previous.searched and (
+            previous.question.strip().lower() == question.strip().lower()
+        ):
+            logger.info("Repeated question, reusing previous cache lookup")
+            current_query.cache_results = list(previous.cache_results)
+            current_query.cache_hit = previous.cache_hit
+            current_query.searched = True
+            return {"current_phase": _phase_after_search(current_query)}
+    
+    app_state = _app_state()
+    
+    logger.info("Searching cache for: %.100s...", question)
     
     # Search the knowledge base
     if app_state.knowledge_base:
         results, embedding_cost = await app_state.knowledge_base.search(question, top_k=3)
         
-        # Track embedding cost
-        updated_costs = state.costs.model_copy()
-        updated_costs.spent_embeddings += embedding_cost
+        # Track embedding cost (in place; the node returns state.costs)
+        state.costs.spent_embeddings += embedding_cost
+        current_query.searched = True
         
         if results:
             logger.info(
-                f"Cache HIT! Found {len(results)} similar answers "
-                f"(best score: {results[0].get('relevance_score', 0):.3f})"
+                "Cache HIT! Found %d similar answers (best score: %.3f)",
+                len(results),
+                results[0].get("relevance_score", 0),
             )
             
             # Store results in the query for review
-            current_query["cache_results"] = results
-            current_query["cache_hit"] = True
+            current_query.cache_results = results
+            current_query.cache_hit = True
             
-            # Update state
+            # The query was updated in place; no reducer merges expert_queries.
+            # Only a confident hit skips human review
             return {
-                "expert_queries": state.expert_queries,
-                "costs": updated_costs,
-                "current_phase": Phase.HUMAN_REVIEW,  # Still show to human for approval
+                "costs": state.costs,
+                "current_phase": _phase_after_search(current_query),
             }
         else:
             logger.info("Cache MISS - no similar answers found")
-            current_query["cache_hit"] = False
+            current_query.cache_hit = False
     else:
         logger.warning("Knowledge base not initialized")
-        current_query["cache_hit"] = False
-        updated_costs = state.costs
+        current_query.cache_hit = False
     
     return {
-        "expert_queries": state.expert_queries,
-        "costs": updated_costs,
+        "costs": state.costs,
         "current_phase": Phase.HUMAN_REVIEW,
     }
-    # Stub: skip cache, go straight to human review
-    state.current_phase = Phase.HUMAN_REVIEW
-    return {"current_phase": Phase.HUMAN_REVIEW}
+
+
+def _phase_after_search(query: ExpertQuery) -> Phase:
+    """Phase the graph moves to once query has been looked up."""
+    results = query.cache_results
+    if query.cache_hit and results and results[0].get("relevance_score", 0) > CACHE_HIT_SCORE:
+        return Phase.WORKER_EXECUTE
+    return Phase.HUMAN_REVIEW
 
 
 async def human_review_node(state: FocusGroupState) -> dict:
@@ -204,15 +328,13 @@ async def expert_answer_node(state: FocusGroupState) -> dict:
 
     Delegates to agents.expert.answer()
     """
-    from piedpiper.main import app_state
-    
     # Get the current expert query
     if not state.expert_queries:
         logger.warning("No expert queries to answer")
         return {}
     
     current_query = state.expert_queries[-1]
-    question = current_query.get("question", "")
+    question = current_query.question
     
     # TODO: Call expert agent to generate answer
     # For now, we'll just show how caching works
@@ -222,35 +344,20 @@ async def expert_answer_node(state: FocusGroupState) -> dict:
     # This would typically be called after human approves the answer
     
     # Example of storing in cache with cost tracking:
-    # if app_state.knowledge_base and current_query.get("approved_by"):
-    #     doc_id, embedding_cost = await app_state.knowledge_base.store(
+    # knowledge_base = _app_state().knowledge_base
+    # if knowledge_base and current_query.approved_by:
+    #     doc_id, embedding_cost = await knowledge_base.store(
     #         question=question,
     #         answer=expert_answer,
-    #         approved_by=current_query["approved_by"],
-    #         category=current_query.get("category", "general"),
+    #         approved_by=current_query.approved_by,
+    #         category=current_query.category or "general",
     #     )
-    #     
-    #     # Track costs
-    #     updated_costs = state.costs.model_copy()
-    #     updated_costs.spent_embeddings += embedding_cost
-    #     
-    #     logger.info(f"✓ Cached expert answer for: {question[:100]}... (id: {doc_id})")
-    #     
-    #     return {"costs": updated_costs}
+    #     state.costs.spent_embeddings += embedding_cost
+    #     logger.info("✓ Cached expert answer for: %.100s... (id: %s)", question, doc_id)
+    #     return {"costs": state.costs}
     
     # TODO: implement full expert answer flow
     raise NotImplementedError
-    # Stub: add a placeholder answer to first stuck worker
-    for worker in state.workers:
-        if not worker.completed:
-            worker.conversation_history.append({
-                "role": "expert",
-                "content": "Stub expert answer: try checking the documentation."
-            })
-            break
-    
-    state.current_phase = Phase.WORKER_EXECUTE
-    return {"workers": state.workers, "current_phase": Phase.WORKER_EXECUTE}
 
 
 async def browserbase_test_node(state: FocusGroupState) -> dict:
@@ -288,5 +395,6 @@ async def expert_learn_node(state: FocusGroupState) -> dict:
     Delegates to agents.learning.evaluate_and_learn()
     """
     # Stub: mark as completed
+    _release_agents(state.session_id)
     state.current_phase = Phase.COMPLETED
     return {"current_phase": Phase.COMPLETED}
@@ -0,0 +1,32 @@
+"""Tests for the per-event-loop shared Redis client."""
+
+import asyncio
+
+import pytest
+
+from piedpiper.infra.redis import client as client_module
+from piedpiper.infra.redis import get_client
+
+URL = "redis://localhost:6379/0"
+
+
+async def test_same_loop_shares_one_client_per_url():
+    assert get_client(URL) is get_client(URL)
+    assert get_client(URL) is not get_client("redis://localhost:6379/1")
+
+
+def test_each_event_loop_gets_its_own_client():
+    async def resolve():
+        return asyncio.get_running_loop(), get_client(URL)
+
+    first_loop, first = asyncio.run(resolve())
+    _, second = asyncio.run(resolve())
+
+    assert first is not second
+    # The first loop had closed, so its clients were dropped
+    assert first_loop not in client_module._clients
+
+
+def test_requires_a_running_loop():
+    with pytest.raises(RuntimeError):
+        get_client(URL)
@@ -0,0 +1,116 @@
+"""Tests for EmbeddingService's micro-batching of concurrent embed() calls."""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from piedpiper.infra.redis import EmbeddingService
+
+
+class FakeEmbeddings:
+    """Stands in for client.embeddings; returns [index, len(text)] vectors."""
+
+    def __init__(self, error: BaseException | None = None, drop: int = 0):
+        self.calls: list[list[str]] = []
+        self.error = error
+        self.drop = drop
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def create(self, model, input, encoding_format):
+        self.calls.append(list(input))
+        self.started.set()
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        data = [
+            SimpleNamespace(embedding=[float(i), float(len(text))])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=data[: len(data) - self.drop])
+
+
+def _service(embeddings: FakeEmbeddings) -> EmbeddingService:
+    service = EmbeddingService(openai_api_key="test")
+    service.client = SimpleNamespace(embeddings=embeddings)
+    return service
+
+
+async def test_concurrent_embeds_share_one_request():
+    embeddings = FakeEmbeddings()
+    service = _service(embeddings)
+
+    first, second, repeat = await asyncio.gather(
+        service.embed("alpha"), service.embed("beta!"), service.embed("alpha")
+    )
+
+    assert embeddings.calls == [["alpha", "beta!"]]
+    np.testing.assert_array_equal(first, [0.0, 5.0])
+    np.testing.assert_array_equal(second, [1.0, 5.0])
+    np.testing.assert_array_equal(repeat, first)
+
+
+async def test_full_batch_flushes_without_waiting(monkeypatch):
+    monkeypatch.setattr(EmbeddingService, "EMBED_BATCH_MAX", 2)
+    monkeypatch.setattr(EmbeddingService, "EMBED_BATCH_WINDOW_SECONDS", 60)
+    embeddings = FakeEmbeddings()
+    service = _service(embeddings)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(service.embed("a"), service.embed("b")), timeout=1
+    )
+
+    assert embeddings.calls == [["a", "b"]]
+    assert len(results) == 2
+
+
+async def test_request_error_reaches_every_caller():
+    embeddings = FakeEmbeddings(error=RuntimeError("rate limited"))
+    service = _service(embeddings)
+
+    results = await asyncio.gather(
+        service.embed("a"), service.embed("b"), service.embed("a"), return_exceptions=True
+    )
+
+    assert len(embeddings.calls) == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "rate limited" for r in results)
+
+
+async def test_short_response_fails_the_missing_callers():
+    embeddings = FakeEmbeddings(drop=1)
+    service = _service(embeddings)
+
+    first, second = await asyncio.gather(
+        service.embed("a"), service.embed("b"), return_exceptions=True
+    )
+
+    np.testing.assert_array_equal(first, [0.0, 1.0])
+    assert isinstance(second, RuntimeError)
+
+
+async def test_cancelled_batch_releases_waiters():
+    embeddings = FakeEmbeddings()
+    embeddings.release.clear()
+    service = _service(embeddings)
+
+    waiters = [asyncio.create_task(service.embed(text)) for text in ("a", "b")]
+    await embeddings.started.wait()
+    (batch,) = service._background
+    batch.cancel()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*waiters, return_exceptions=True), timeout=1
+    )
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert batch.cancelled()
+
+
+async def test_empty_text_is_rejected():
+    service = _service(FakeEmbeddings())
+
+    with pytest.raises(ValueError):
+        await service.embed("   ")
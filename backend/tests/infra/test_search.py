@@ -0,0 +1,128 @@
+"""Tests for HybridKnowledgeBase storage and document fetches against fake clients."""
+
+import numpy as np
+import orjson
+import pytest
+from redis.asyncio import Redis
+
+from piedpiper.infra.redis import HybridKnowledgeBase
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def execute_command(self, *args):
+        self.commands.append(args)
+
+    async def execute(self, raise_on_error=True):
+        return [await self.redis.execute_command(*args) for args in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+
+    def ft(self, index_name):
+        return None
+
+    async def execute_command(self, command, key, *args):
+        """Raw RedisJSON replies: JSON.SET takes and JSON.GET returns encoded bytes."""
+        if command == "JSON.SET":
+            path, payload = args
+            self.documents[key] = orjson.loads(payload)
+            return b"OK"
+        if command == "JSON.GET":
+            document = self.documents.get(key)
+            if document is None:
+                return None
+            return orjson.dumps({path: [document[path[2:]]] for path in args})
+        raise AssertionError(f"unexpected command {command}")
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeEmbeddingService:
+    """Embeds each text as [len(text)], so vectors are traceable to their text."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [np.array([len(text)], dtype=np.float32) for text in texts if text.strip()]
+
+    def get_cost_for_batch(self, num_texts):
+        return 0.0
+
+
+@pytest.fixture
+def kb():
+    return HybridKnowledgeBase(redis_client=FakeRedis(), embedding_service=FakeEmbeddingService())
+
+
+async def test_store_many_pairs_each_item_with_its_embeddings(kb):
+    items = [
+        {"question": "q", "answer": "answer one"},
+        {"question": "qq", "answer": "a2", "category": "auth"},
+    ]
+
+    doc_ids, _ = await kb.store_many(items, approved_by="alice")
+
+    assert kb.embedding_service.batches == [["q", "answer one", "qq", "a2"]]
+    for doc_id, item in zip(doc_ids, items):
+        document = kb.redis.documents[f"{kb.KEY_PREFIX}{doc_id}"]
+        assert document["question_embedding"][0] == len(item["question"])
+        assert document["answer_embedding"][0] == len(item["answer"])
+    assert kb.redis.documents[f"{kb.KEY_PREFIX}{doc_ids[1]}"]["metadata"]["category"] == "auth"
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"question": "   ", "answer": "a"},
+        {"question": "q", "answer": "\n\t"},
+        {"question": "q"},
+    ],
+)
+async def test_store_many_rejects_blank_text(kb, item):
+    items = [{"question": "q", "answer": "a"}, item, {"question": "q3", "answer": "a3"}]
+
+    with pytest.raises(ValueError):
+        await kb.store_many(items, approved_by="alice")
+
+    assert kb.embedding_service.batches == []
+    assert kb.redis.documents == {}
+
+
+async def test_store_rejects_blank_text(kb):
+    with pytest.raises(ValueError):
+        await kb.store("  ", "answer", approved_by="alice")
+
+
+async def test_fetch_documents_decodes_raw_json_get_replies(kb):
+    doc_ids, _ = await kb.store_many([{"question": "q", "answer": "a"}], approved_by="alice")
+
+    documents = await kb._fetch_documents([doc_ids[0], "q_missing"])
+
+    assert documents[0]["question"] == "q"
+    assert documents[0]["metadata"]["approved_by"] == "alice"
+    assert "question_embedding" not in documents[0]
+    assert documents[1] is None
+
+
+def test_knowledge_base_leaves_shared_client_callbacks_alone():
+    client = Redis.from_url("redis://localhost:6379/0")
+    callbacks = dict(client.response_callbacks)
+
+    HybridKnowledgeBase(redis_client=client, embedding_service=FakeEmbeddingService())
+
+    assert client.response_callbacks == callbacks
@@ -0,0 +1,334 @@
+"""Tests for HumanReviewQueue, in memory and against a fake asyncpg pool."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from piedpiper.models.queries import ExpertQuery
+from piedpiper.models.review import ReviewDecision, ReviewStatus
+from piedpiper.review import queue as queue_module
+from piedpiper.review.queue import HumanReviewQueue
+
+
+class FakeConnection:
+    def __init__(self, pool: "FakePool"):
+        self.pool = pool
+
+    async def execute(self, sql, *args):
+        self.pool.calls.append(("execute", sql, args))
+
+    async def executemany(self, sql, rows):
+        await self.pool.writable.wait()
+        if self.pool.failures_left:
+            self.pool.failures_left -= 1
+            raise RuntimeError("database unavailable")
+        self.pool.calls.append(("executemany", sql, list(rows)))
+
+    async def fetch(self, sql, *args):
+        self.pool.calls.append(("fetch", sql, args))
+        return self.pool.pending_rows
+
+    def transaction(self):
+        pool = self.pool
+
+        class Transaction:
+            async def __aenter__(self):
+                pool.transactions += 1
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Transaction()
+
+
+class FakePool:
+    """Records every statement instead of talking to Postgres."""
+
+    def __init__(self, pending_rows=None):
+        self.calls: list[tuple] = []
+        self.pending_rows = pending_rows or []
+        self.transactions = 0
+        # Number of upcoming executemany() calls that fail
+        self.failures_left = 0
+        # Cleared to hold executemany() calls mid-write
+        self.writable = asyncio.Event()
+        self.writable.set()
+
+    def acquire(self):
+        conn = FakeConnection(self)
+
+        class Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+    def writes(self, sql):
+        return [rows for kind, stmt, rows in self.calls if kind == "executemany" and stmt == sql]
+
+
+def _query(question="How do I paginate?", worker_id="junior"):
+    return ExpertQuery(question=question, worker_id=worker_id)
+
+
+def _decision(review_id, status=ReviewStatus.APPROVED):
+    return ReviewDecision(review_id=review_id, decision=status, reviewer_id="alice")
+
+
+@pytest.fixture
+def fast_flush(monkeypatch):
+    monkeypatch.setattr(HumanReviewQueue, "FLUSH_INTERVAL_SECONDS", 0.001)
+
+
+async def _until(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+async def test_initialize_creates_table_and_reloads_pending():
+    row = {
+        "id": "r1",
+        "timestamp": datetime(2026, 1, 1),
+        "question": "Why does auth fail?",
+        "worker_id": "senior",
+        "worker_context": "",
+        "arbiter_urgency": 0.5,
+        "arbiter_classification": "api_error",
+        "similar_cached": json.dumps([{"id": "q_1"}]),
+        "status": "pending",
+        "reviewer_id": None,
+        "reviewed_at": None,
+    }
+    pool = FakePool(pending_rows=[row])
+    queue = HumanReviewQueue(pool=pool)
+    await queue.initialize()
+    try:
+        kinds = [(kind, stmt) for kind, stmt, _ in pool.calls]
+        assert kinds[0] == ("execute", queue_module._CREATE_TABLE_SQL)
+        assert kinds[1] == ("fetch", queue_module._SELECT_PENDING_SQL)
+        assert pool.calls[1][2] == ("pending",)
+
+        pending = await queue.get_pending()
+        assert [item.id for item in pending] == ["r1"]
+        assert pending[0].similar_cached == [{"id": "q_1"}]
+    finally:
+        await queue.close()
+
+
+async def test_in_memory_queue_keeps_submission_order():
+    queue = HumanReviewQueue()
+    await queue.initialize()
+    try:
+        ids = [await queue.submit(_query(f"q{i}"), {}) for i in range(3)]
+        await queue.process_decision(_decision(ids[1]))
+
+        assert [item.id for item in await queue.get_pending()] == [ids[0], ids[2]]
+        assert (await queue.get_item(ids[1])).status is ReviewStatus.APPROVED
+    finally:
+        await queue.close()
+
+
+async def test_flush_loop_batches_buffered_submissions(fast_flush):
+    pool = FakePool()
+    queue = HumanReviewQueue(pool=pool)
+    await queue.initialize()
+    try:
+        ids = [await queue.submit(_query(f"q{i}"), {"urgency_score": 0.9}) for i in range(3)]
+        await _until(lambda: pool.writes(queue_module._INSERT_SQL))
+
+        batches = pool.writes(queue_module._INSERT_SQL)
+        assert len(batches) == 1
+        assert [row[0] for row in batches[0]] == ids
+        assert batches[0][0][5] == 0.9
+        assert pool.transactions == 1
+    finally:
+        await queue.close()
+
+
+async def test_flush_loop_retries_failed_batches(fast_flush):
+    pool = FakePool()
+    pool.failures_left = 2
+    queue = HumanReviewQueue(pool=pool)
+    await queue.initialize()
+    try:
+        review_id = await queue.submit(_query("retried"), {})
+        await _until(lambda: pool.writes(queue_module._INSERT_SQL))
+
+        assert pool.failures_left == 0
+        assert [row[0] for row in pool.writes(queue_module._INSERT_SQL)[0]] == [review_id]
+        assert queue._write_attempts == {}
+    finally:
+        await queue.close()
+
+
+async def test_flush_loop_drops_items_after_max_attempts(fast_flush, monkeypatch):
+    monkeypatch.setattr(HumanReviewQueue, "FLUSH_MAX_ATTEMPTS", 2)
+    pool = FakePool()
+    pool.failures_left = 2
+    queue = HumanReviewQueue(pool=pool)
+    await queue.initialize()
+    try:
+        await queue.submit(_query("dropped"), {})
+        await _until(lambda: pool.failures_left == 0 and queue._write_buffer.empty())
+
+        assert pool.writes(queue_module._INSERT_SQL) == []
+        assert queue._write_attempts == {}
+        # The item is still served from memory
+        assert len(await queue.get_pending()) == 1
+    finally:
+        await queue.close()
+
+
+async def test_close_writes_out_the_buffer():
+    pool = FakePool()
+    queue = HumanReviewQueue(pool=pool)
+    await queue.initialize()
+    review_id = await queue.submit(_query(), {})
+    # Close before the flush loop gets a turn; close() drains what is left
+    await queue.close()
+
+    inserted = [row[0] for rows in pool.writes(queue_module._INSERT_SQL) for row in rows]
+    assert inserted == [review_id]
+    assert queue._flush_task is None and queue._janitor_task is None
+
+
+async def test_close_writes_the_batch_the_flush_loop_was_writing(fast_flush):
+    pool = FakePool()
+    pool.writable.clear()
+    queue = HumanReviewQueue(pool=pool)
+    await queue.initialize()
+    review_id = await queue.submit(_query(), {})
+    # Let the flush loop take the item off the buffer and block in executemany()
+    await _until(queue._write_buffer.empty)
+
+    closing = asyncio.create_task(queue.close())
+    await asyncio.sleep(0)
+    pool.writable.set()
+    await closing
+
+    inserted = [row[0] for rows in pool.writes(queue_module._INSERT_SQL) for row in rows]
+    assert inserted == [review_id]
+
+
+async def test_submit_many_inserts_in_one_transaction():
+    pool = FakePool()
+    queue = HumanReviewQueue(pool=pool)
+    queries = [_query(f"q{i}") for i in range(4)]
+    contexts = [{"issue_type": "api_error"}] * 4
+
+    ids = await queue.submit_many(queries, contexts)
+
+    batches = pool.writes(queue_module._INSERT_SQL)
+    assert len(batches) == 1 and pool.transactions == 1
+    assert [row[0] for row in batches[0]] == ids
+    # One clock read for the whole burst
+    assert len({row[1] for row in batches[0]}) == 1
+    assert [item.id for item in await queue.get_pending()] == ids
+
+
+async def test_process_decision_upserts_and_rejects_unknown_ids():
+    pool = FakePool()
+    queue = HumanReviewQueue(pool=pool)
+    review_id = await queue.submit(_query(), {})
+
+    await queue.process_decision(_decision(review_id, ReviewStatus.REJECTED))
+
+    upserts = [args for kind, stmt, args in pool.calls if stmt == queue_module._UPSERT_SQL]
+    assert len(upserts) == 1
+    row = upserts[0]
+    assert row[0] == review_id and row[8] == "rejected" and row[9] == "alice"
+    assert await queue.get_pending() == []
+
+    with pytest.raises(ValueError):
+        await queue.process_decision(_decision("missing"))
+
+
+async def test_process_decisions_skips_unknown_and_upserts_once():
+    pool = FakePool()
+    queue = HumanReviewQueue(pool=pool)
+    first = await queue.submit(_query("a"), {})
+    second = await queue.submit(_query("b"), {})
+    waiter = asyncio.create_task(queue.wait_for_decision(first, timeout=1))
+    await asyncio.sleep(0)
+
+    await queue.process_decisions(
+        [_decision(first), _decision("missing"), _decision(second, ReviewStatus.MODIFIED)]
+    )
+
+    assert (await waiter).review_id == first
+    batches = pool.writes(queue_module._UPSERT_SQL)
+    assert len(batches) == 1 and pool.transactions == 1
+    assert [(row[0], row[8]) for row in batches[0]] == [(first, "approved"), (second, "modified")]
+    assert await queue.get_pending() == []
+
+
+async def test_wait_for_decision_wakes_on_decision():
+    queue = HumanReviewQueue()
+    review_id = await queue.submit(_query(), {})
+    waiter = asyncio.create_task(queue.wait_for_decision(review_id, timeout=1))
+    await asyncio.sleep(0)
+
+    await queue.process_decision(_decision(review_id))
+
+    decision = await waiter
+    assert decision.decision is ReviewStatus.APPROVED
+    assert review_id not in queue._events and review_id not in queue._decisions
+
+
+async def test_wait_for_decision_returns_early_decision():
+    queue = HumanReviewQueue()
+    review_id = await queue.submit(_query(), {})
+    await queue.process_decision(_decision(review_id))
+
+    decision = await queue.wait_for_decision(review_id, timeout=0.01)
+
+    assert decision.review_id == review_id
+    assert review_id not in queue._decisions
+
+
+async def test_wait_for_decision_times_out():
+    queue = HumanReviewQueue()
+    review_id = await queue.submit(_query(), {})
+
+    assert await queue.wait_for_decision(review_id, timeout=0.01) is None
+    assert review_id not in queue._events
+
+    with pytest.raises(ValueError):
+        await queue.wait_for_decision("missing", timeout=0.01)
+
+
+async def test_get_all_snapshot_is_rebuilt_after_membership_changes():
+    queue = HumanReviewQueue()
+    await queue.submit(_query("a"), {})
+    snapshot = await queue.get_all()
+    assert await queue.get_all() is snapshot
+
+    await queue.submit(_query("b"), {})
+    rebuilt = await queue.get_all()
+    assert rebuilt is not snapshot and len(rebuilt) == 2
+
+
+async def test_evict_decided_drops_only_old_decided_items():
+    queue = HumanReviewQueue()
+    old_decided = await queue.submit(_query("old"), {})
+    new_decided = await queue.submit(_query("new"), {})
+    pending = await queue.submit(_query("pending"), {})
+    await queue.process_decisions([_decision(old_decided), _decision(new_decided)])
+    queue._queue[old_decided].reviewed_at = datetime.utcnow() - timedelta(days=2)
+    snapshot = await queue.get_all()
+
+    evicted = queue._evict_decided(datetime.utcnow() - HumanReviewQueue.DECIDED_RETENTION)
+
+    assert evicted == 1
+    assert await queue.get_item(old_decided) is None
+    assert await queue.get_item(new_decided) is not None
+    assert [item.id for item in await queue.get_pending()] == [pending]
+    assert await queue.get_all() is not snapshot
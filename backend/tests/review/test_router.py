@@ -0,0 +1,43 @@
+"""Tests for the review dashboard routes, served from an in-memory queue."""
+
+import warnings
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from piedpiper.models.queries import ExpertQuery
+from piedpiper.review.queue import HumanReviewQueue
+from piedpiper.review.router import get_queue, router
+
+
+@pytest.fixture
+def queue():
+    return HumanReviewQueue()
+
+
+@pytest.fixture
+def client(queue):
+    app = FastAPI()
+    app.include_router(router, prefix="/review")
+    app.dependency_overrides[get_queue] = lambda: queue
+    return TestClient(app)
+
+
+async def test_list_and_decide_without_warnings(queue, client):
+    review_id = await queue.submit(ExpertQuery(question="How?", worker_id="junior"), {})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        items = client.get("/review/items").json()
+        decided = client.post(
+            f"/review/items/{review_id}/decide",
+            json={"review_id": review_id, "decision": "approved", "reviewer_id": "alice"},
+        )
+        pending = client.get("/review/items/pending").json()
+
+    assert [item["id"] for item in items] == [review_id]
+    assert items[0]["timestamp"]
+    assert decided.json() == {"status": "ok"}
+    assert pending == []
+    assert client.get("/review/items/missing").status_code == 404
@@ -29,37 +29,40 @@ async def test_connection():
             decode_responses=True,
         )
         
+        # Queue every probe and send them in a single round-trip
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.ping()
+            pipe.set('test_key', 'hello_from_piedpiper')
+            pipe.get('test_key')
+            pipe.info('server')
+            pipe.execute_command('MODULE', 'LIST')
+            pipe.delete('test_key')  # Cleanup
+            response, _, value, info, modules, _ = await pipe.execute()
+        
         # Test PING
         print("1. Testing PING...")
-        response = await redis.ping()
         print(f"   ✓ PING successful: {response}")
         
         # Test SET
         print("\n2. Testing SET...")
-        await redis.set('test_key', 'hello_from_piedpiper')
         print("   ✓ SET successful")
         
         # Test GET
         print("\n3. Testing GET...")
-        value = await redis.get('test_key')
         print(f"   ✓ GET successful: {value}")
         
         # Test INFO
         print("\n4. Getting server info...")
-        info = await redis.info('server')
         print(f"   ✓ Redis version: {info.get('redis_version')}")
         print(f"   ✓ Redis mode: {info.get('redis_mode')}")
         
         # Check for Redis Stack modules
         print("\n5. Checking Redis Stack modules...")
-        modules = await redis.execute_command('MODULE', 'LIST')
         print(f"   ✓ Loaded modules: {len(modules)}")
         for module in modules:
             module_name = module[1].decode() if isinstance(module[1], bytes) else module[1]
             print(f"      - {module_name}")
         
-        # Cleanup
-        await redis.delete('test_key')
         await redis.close()
         
         print("\n" + "="*60)
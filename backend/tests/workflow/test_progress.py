@@ -0,0 +1,77 @@
+"""Tests that the progress counters track the worker flags the routing reads."""
+
+from piedpiper.models.state import DEFAULT_WORKERS, FocusGroupState, Phase, WorkerState
+from piedpiper.workflow import nodes
+from piedpiper.workflow.graph import _route_after_progress_check
+
+
+def _state() -> FocusGroupState:
+    return FocusGroupState(
+        workers=[WorkerState(worker_id=config.id, config=config) for config in DEFAULT_WORKERS]
+    )
+
+
+def _assert_counters_match_flags(state: FocusGroupState):
+    assert state.completed_count == sum(worker.completed for worker in state.workers)
+    assert state.stuck_count == sum(worker.stuck for worker in state.workers)
+
+
+def _make_stuck(worker: WorkerState):
+    # Long without progress and looping on errors: ArbiterAgent escalates
+    worker.minutes_without_progress = 10
+    worker.recent_errors.extend(["ImportError"] * 4)
+
+
+async def test_stuck_worker_routes_to_arbiter_and_is_cleared():
+    state = _state()
+    _make_stuck(state.workers[0])
+
+    update = await nodes.check_progress_node(state)
+
+    assert update["current_phase"] is Phase.ARBITER
+    assert state.workers[0].stuck
+    assert _route_after_progress_check(state) == "stuck"
+    _assert_counters_match_flags(state)
+
+    await nodes.arbiter_node(state)
+
+    assert not state.workers[0].stuck
+    _assert_counters_match_flags(state)
+
+
+async def test_check_progress_does_not_count_a_stuck_worker_twice():
+    state = _state()
+    _make_stuck(state.workers[0])
+
+    await nodes.check_progress_node(state)
+    await nodes.check_progress_node(state)
+
+    assert state.stuck_count == 1
+    _assert_counters_match_flags(state)
+
+
+async def test_completion_clears_stuck_and_routes_to_success():
+    state = _state()
+    _make_stuck(state.workers[1])
+    await nodes.check_progress_node(state)
+
+    await nodes.worker_execute_node(state)
+
+    _assert_counters_match_flags(state)
+    assert state.completed_count == len(state.workers)
+    assert state.stuck_count == 0
+
+    update = await nodes.check_progress_node(state)
+
+    assert update["current_phase"] is Phase.BROWSERBASE_TEST
+    assert _route_after_progress_check(state) == "success"
+
+
+async def test_healthy_workers_keep_executing():
+    state = _state()
+
+    update = await nodes.check_progress_node(state)
+
+    assert update["current_phase"] is Phase.WORKER_EXECUTE
+    assert _route_after_progress_check(state) == "continue"
+    _assert_counters_match_flags(state)
@@ -0,0 +1,109 @@
+"""Tests for the graph's routing functions and the phases the nodes report."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from piedpiper.models.queries import ExpertQuery
+from piedpiper.models.state import FocusGroupState, Phase
+from piedpiper.workflow import nodes
+from piedpiper.workflow.graph import _route_after_arbiter, _route_after_search
+
+
+class FakeKnowledgeBase:
+    def __init__(self, results):
+        self.results = results
+        self.searches: list[str] = []
+
+    async def search(self, question, top_k=3):
+        self.searches.append(question)
+        return self.results, 0.0001
+
+
+@pytest.fixture
+def knowledge_base(monkeypatch):
+    def install(results):
+        kb = FakeKnowledgeBase(results)
+        monkeypatch.setattr(nodes, "_app_state", lambda: SimpleNamespace(knowledge_base=kb))
+        return kb
+
+    return install
+
+
+def _state(*questions):
+    return FocusGroupState(
+        expert_queries=[ExpertQuery(question=q, worker_id="junior") for q in questions]
+    )
+
+
+async def test_arbiter_without_question_returns_to_worker():
+    state = FocusGroupState()
+
+    update = await nodes.arbiter_node(state)
+
+    assert update["current_phase"] is Phase.WORKER_EXECUTE
+    assert _route_after_arbiter(state) == "no_query"
+
+
+async def test_arbiter_escalates_new_question():
+    state = _state("How do I paginate?")
+
+    update = await nodes.arbiter_node(state)
+
+    assert update["current_phase"] is Phase.HYBRID_SEARCH
+    assert _route_after_arbiter(state) == "escalate"
+
+
+async def test_second_arbiter_pass_without_new_question_skips_search(knowledge_base):
+    kb = knowledge_base([])
+    state = _state("How do I paginate?")
+    await nodes.arbiter_node(state)
+    await nodes.hybrid_search_node(state)
+
+    # The worker gets stuck again without asking anything new
+    update = await nodes.arbiter_node(state)
+
+    assert update["current_phase"] is Phase.WORKER_EXECUTE
+    assert _route_after_arbiter(state) == "no_query"
+    assert len(kb.searches) == 1
+
+
+@pytest.mark.parametrize(
+    ("score", "route", "phase"),
+    [
+        (0.95, "cache_hit", Phase.WORKER_EXECUTE),
+        (0.7, "cache_miss", Phase.HUMAN_REVIEW),
+        (0.2, "cache_miss", Phase.HUMAN_REVIEW),
+    ],
+)
+async def test_search_phase_matches_route(knowledge_base, score, route, phase):
+    knowledge_base([{"question": "How do I paginate?", "relevance_score": score}])
+    state = _state("How do I paginate?")
+
+    update = await nodes.hybrid_search_node(state)
+
+    assert update["current_phase"] is phase
+    assert _route_after_search(state) == route
+
+
+async def test_search_miss_goes_to_review(knowledge_base):
+    knowledge_base([])
+    state = _state("How do I paginate?")
+
+    update = await nodes.hybrid_search_node(state)
+
+    assert update["current_phase"] is Phase.HUMAN_REVIEW
+    assert _route_after_search(state) == "cache_miss"
+
+
+async def test_repeated_question_reuses_lookup_and_route(knowledge_base):
+    kb = knowledge_base([{"question": "How do I paginate?", "relevance_score": 0.95}])
+    state = _state("How do I paginate?")
+    await nodes.hybrid_search_node(state)
+    state.expert_queries.append(ExpertQuery(question="how do I paginate? ", worker_id="junior"))
+
+    update = await nodes.hybrid_search_node(state)
+
+    assert len(kb.searches) == 1
+    assert update["current_phase"] is Phase.WORKER_EXECUTE
+    assert _route_after_search(state) == "cache_hit"